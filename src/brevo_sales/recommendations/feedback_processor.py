@@ -3,8 +3,9 @@ Feedback processor that updates company context with learnings.
 """
 import logging
 import re
+from datetime import date
 from pathlib import Path
-from typing import Dict, Any
+from typing import ClassVar, Dict, Any
 from brevo_sales.recommendations.models import FeedbackInput, FeedbackResult
 from brevo_sales.recommendations.context_loader import CompanyContextLoader
 from brevo_sales.recommendations.cache import RecommendationCache
@@ -15,6 +16,14 @@ logger = logging.getLogger(__name__)
 class FeedbackProcessor:
     """Processes user feedback and updates company context with learnings."""
 
+    # Built once at class creation instead of per _determine_section call
+    _SECTION_MAP: ClassVar[Dict[str, str]] = {
+        "email": "Email Engagement Learnings",
+        "phone": "Call Strategy Learnings",
+        "linkedin": "LinkedIn Outreach Learnings",
+        "whatsapp": "WhatsApp Communication Learnings"
+    }
+
     def __init__(self, cache: RecommendationCache, context_file: Path):
         """
         Initialize feedback processor.
@@ -59,7 +68,7 @@ class FeedbackProcessor:
             section = self._determine_section(feedback.action_channel)
 
             # Update company context
-            CompanyContextLoader.update_context(
+            new_version = CompanyContextLoader.update_context(
                 context_file=self.context_file,
                 section=section,
                 new_content=learning,
@@ -74,10 +83,6 @@ class FeedbackProcessor:
                 source_feedback_id=feedback_id if feedback_id != -1 else None
             )
 
-            # Get new version
-            context_data = CompanyContextLoader.load_context(self.context_file)
-            new_version = context_data["version"]
-
             return FeedbackResult(
                 status="success",
                 learning_extracted=learning,
@@ -100,11 +105,9 @@ class FeedbackProcessor:
 
     def _extract_learning(self, feedback: FeedbackInput) -> str:
         """Extract actionable learning from feedback."""
-        import datetime
-
         # Build learning entry
-        date = datetime.datetime.now().strftime('%Y-%m-%d')
-        
+        today = date.today().isoformat()
+
         # Create instruction from feedback
         if feedback.feedback_type == "positive" and feedback.what_worked:
             instruction = f"{feedback.what_worked}"
@@ -117,16 +120,10 @@ class FeedbackProcessor:
 
         # Format learning entry
         context = f"{feedback.action_priority} {feedback.action_channel} action"
-        learning = f"- **{date}**: {instruction} _(Context: {context})_"
+        learning = f"- **{today}**: {instruction} _(Context: {context})_"
 
         return learning
 
     def _determine_section(self, channel: str) -> str:
         """Determine which section to update based on channel."""
-        section_map = {
-            "email": "Email Engagement Learnings",
-            "phone": "Call Strategy Learnings",
-            "linkedin": "LinkedIn Outreach Learnings",
-            "whatsapp": "WhatsApp Communication Learnings"
-        }
-        return section_map.get(channel, "General Learnings")
+        return self._SECTION_MAP.get(channel, "General Learnings")
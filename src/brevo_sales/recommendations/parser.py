@@ -6,10 +6,13 @@ Implements three-tier parsing strategy:
 2. Markdown code block extraction (fallback)
 3. Regex pattern extraction (last resort)
 """
+import hashlib
+import heapq
 import json
 import re
 import logging
-from typing import Dict, Any, Optional, Tuple, List
+from collections import OrderedDict
+from typing import Dict, Any, Iterator, Optional, Tuple, List
 from pydantic import ValidationError
 
 from brevo_sales.recommendations.action_models import (
@@ -17,16 +20,98 @@ from brevo_sales.recommendations.action_models import (
     ExecutableAction,
     EmailAction,
     PhoneAction,
-    LinkedInAction,
-    WhatsAppAction,
 )
 
 logger = logging.getLogger(__name__)
 
+# Optional: orjson parses the multi-KB AI responses 2-3x faster than stdlib
+# json. Its JSONDecodeError subclasses json.JSONDecodeError, so the except
+# clauses below work with either implementation.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Compiled once at import - matches ```json and generic ``` fences in a
+# single pass over the response
+_FENCE_RE = re.compile(r'```(?:json)?\s*\n(.*?)\n```', re.DOTALL)
+
+
+def _check_email_completeness(action: ExecutableAction, label: str, warnings: List[str]) -> None:
+    """Channel-specific completeness checks for email actions."""
+    if len(action.action.content) < 50:
+        warnings.append(f"{label}: Email content too short")
+    if len(action.action.subject) < 5:
+        warnings.append(f"{label}: Email subject too short")
+
+
+def _check_phone_completeness(action: ExecutableAction, label: str, warnings: List[str]) -> None:
+    """Channel-specific completeness checks for phone actions."""
+    if len(action.action.talking_points) < 2:
+        warnings.append(f"{label}: Phone action needs at least 2 talking points")
+
+
+# Exact-type dispatch table: a dict lookup replaces chained isinstance checks
+_COMPLETENESS_CHECKS = {
+    EmailAction: _check_email_completeness,
+    PhoneAction: _check_phone_completeness,
+}
+
+# Trusted construction lives on the models themselves
+# (ActionRecommendations.from_trusted_dict); the parser only routes to it.
+
+
+def _find_json_objects(s: str) -> Iterator[str]:
+    """
+    Yield top-level {...} substrings via a linear brace-depth scan.
+
+    Tracks string/escape state so braces inside JSON strings don't confuse the
+    depth counter. Unlike a regex, this handles arbitrary nesting and is
+    guaranteed O(n) even on unbalanced input.
+    """
+    n = len(s)
+    i = 0
+    while True:
+        start = s.find('{', i)
+        if start == -1:
+            return
+
+        depth = 0
+        in_string = False
+        escape = False
+        j = start
+        while j < n:
+            ch = s[j]
+            if in_string:
+                if escape:
+                    escape = False
+                elif ch == '\\':
+                    escape = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch == '{':
+                depth += 1
+            elif ch == '}':
+                depth -= 1
+                if depth == 0:
+                    yield s[start:j + 1]
+                    break
+            j += 1
+        else:
+            # Unbalanced braces - no further complete objects
+            return
+
+        i = j + 1
+
 
 class ParseResult:
     """Result of parsing attempt."""
 
+    __slots__ = ('success', 'data', 'tier_used', 'error', 'raw_response')
+
     def __init__(
         self,
         success: bool,
@@ -62,7 +147,13 @@ class ActionParser:
         """Initialize parser."""
         pass
 
-    def parse(self, response: str, deal_id: str, data_version: str) -> ParseResult:
+    def parse(
+        self,
+        response: str,
+        deal_id: str,
+        data_version: str,
+        trusted: bool = False
+    ) -> ParseResult:
         """
         Parse response using three-tier strategy.
 
@@ -70,38 +161,58 @@ class ActionParser:
             response: Raw text response from AI
             deal_id: Deal ID for context
             data_version: Data version hash for context
+            trusted: The response is JSON this pipeline already validated
+                     once (e.g. a locally cached payload) - skip pydantic
+                     validation and rebuild the models directly
 
         Returns:
             ParseResult with parsed data or error
         """
         logger.info(f"Parsing response ({len(response)} chars) for deal {deal_id}")
 
+        if trusted:
+            try:
+                return ParseResult(
+                    success=True,
+                    data=ActionRecommendations.from_trusted_dict(_loads(response.strip())),
+                    tier_used=1,
+                    raw_response=response
+                )
+            except Exception as e:
+                # A "trusted" payload that doesn't construct cleanly gets the
+                # full validating tier chain below
+                logger.debug("Trusted fast path failed, falling back: %s", e)
+
+        # Cheap lookahead: only attempt a tier when the response can plausibly
+        # satisfy it, so non-JSON error responses skip the json.loads failure
+        # path and the fence regex scan entirely
+        looks_like_json = response.lstrip()[:1] in ('{', '[')
+        has_fences = '```' in response
+
+        # Each tier returns None on failure instead of raising: stringifying
+        # a ValidationError formats every error in it, and on the common
+        # tier-1-fails / tier-2-succeeds path that work was thrown away.
+        # Failure detail is only formatted when debug logging is enabled.
+
         # Tier 1: Direct JSON parsing
-        try:
+        if looks_like_json:
             result = self._parse_tier1_direct_json(response, deal_id, data_version)
-            if result.success:
+            if result is not None:
                 logger.info("✓ Tier 1 (direct JSON) succeeded")
                 return result
-        except Exception as e:
-            logger.debug(f"Tier 1 failed: {e}")
 
         # Tier 2: Markdown code block extraction
-        try:
+        if has_fences:
             result = self._parse_tier2_markdown(response, deal_id, data_version)
-            if result.success:
+            if result is not None:
                 logger.info("✓ Tier 2 (markdown extraction) succeeded")
                 return result
-        except Exception as e:
-            logger.debug(f"Tier 2 failed: {e}")
 
         # Tier 3: Regex fallback
-        try:
-            result = self._parse_tier3_regex(response, deal_id, data_version)
-            if result.success:
-                logger.warning("⚠ Tier 3 (regex fallback) succeeded - data may be incomplete")
-                return result
-        except Exception as e:
-            logger.debug(f"Tier 3 failed: {e}")
+        result = self._parse_tier3_regex(response, deal_id, data_version)
+        if result is not None:
+            logger.warning("⚠ Tier 3 (regex fallback) succeeded - data may be incomplete")
+            return result
 
         # All tiers failed
         error_msg = "All parsing tiers failed. Response may not contain valid JSON or the format is incorrect."
@@ -127,64 +238,54 @@ class ActionParser:
         response: str,
         deal_id: str,
         data_version: str
-    ) -> ParseResult:
+    ) -> Optional[ParseResult]:
         """
         Tier 1: Parse response as direct JSON.
 
         Used when AI returns pure JSON (response_format={"type": "json_object"}).
+        Returns None if the response isn't valid JSON or doesn't match the schema.
         """
         try:
-            # Strip whitespace and try parsing
-            data = json.loads(response.strip())
-
-            # Validate with Pydantic
-            recommendations = ActionRecommendations(**data)
-
-            return ParseResult(
-                success=True,
-                data=recommendations,
-                tier_used=1,
-                raw_response=response
-            )
-
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Not valid JSON: {e}")
+            # Parse and validate in one pass with pydantic-core's native JSON
+            # parser - avoids building an intermediate Python dict
+            recommendations = ActionRecommendations.model_validate_json(response.strip())
         except ValidationError as e:
-            raise ValueError(f"JSON doesn't match schema: {e}")
+            logger.debug("Tier 1 failed: %s", e)
+            return None
+
+        return ParseResult(
+            success=True,
+            data=recommendations,
+            tier_used=1,
+            raw_response=response
+        )
 
     def _parse_tier2_markdown(
         self,
         response: str,
         deal_id: str,
         data_version: str
-    ) -> ParseResult:
+    ) -> Optional[ParseResult]:
         """
         Tier 2: Extract JSON from markdown code blocks.
 
         Looks for ```json ... ``` or ``` ... ``` code blocks.
+        Returns None if no block parses.
         """
-        # Pattern 1: ```json ... ```
-        pattern1 = r'```json\s*\n(.*?)\n```'
-        matches1 = re.findall(pattern1, response, re.DOTALL)
-
-        # Pattern 2: ``` ... ``` (generic code block)
-        pattern2 = r'```\s*\n(.*?)\n```'
-        matches2 = re.findall(pattern2, response, re.DOTALL)
-
-        # Try all matches (json blocks first, then generic)
-        all_matches = matches1 + matches2
-
-        if not all_matches:
-            raise ValueError("No markdown code blocks found")
-
-        # Try each match
+        # Stream fenced blocks lazily in document order and return on the
+        # first block that parses - avoids a second regex pass and
+        # materializing every match when the first one is almost always it
         last_error = None
-        for i, json_text in enumerate(all_matches):
+        attempted = 0
+
+        for match in _FENCE_RE.finditer(response):
+            attempted += 1
             try:
-                data = json.loads(json_text.strip())
-                recommendations = ActionRecommendations(**data)
+                recommendations = ActionRecommendations.model_validate_json(
+                    match.group(1).strip()
+                )
 
-                logger.info(f"Successfully parsed code block {i+1}/{len(all_matches)}")
+                logger.info(f"Successfully parsed code block {attempted}")
                 return ParseResult(
                     success=True,
                     data=recommendations,
@@ -192,50 +293,51 @@ class ActionParser:
                     raw_response=response
                 )
 
-            except (json.JSONDecodeError, ValidationError) as e:
+            except ValidationError as e:
                 last_error = e
-                logger.debug(f"Code block {i+1} failed: {e}")
                 continue
 
-        # All code blocks failed
-        raise ValueError(f"All {len(all_matches)} code blocks failed to parse. Last error: {last_error}")
+        if not attempted:
+            logger.debug("Tier 2 failed: no markdown code blocks found")
+        else:
+            logger.debug(
+                "Tier 2 failed: all %d code blocks failed to parse. Last error: %s",
+                attempted, last_error
+            )
+        return None
 
     def _parse_tier3_regex(
         self,
         response: str,
         deal_id: str,
         data_version: str
-    ) -> ParseResult:
+    ) -> Optional[ParseResult]:
         """
         Tier 3: Regex fallback to extract partial data.
 
         Last resort - tries to extract what it can using regex patterns.
-        May return incomplete data.
+        May return incomplete data. Returns None if nothing parses.
         """
-        # Try to find anything that looks like JSON
-        # Pattern: Look for { ... } structures
-        pattern = r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
-
-        # Find the largest JSON-like structure
-        matches = re.findall(pattern, response, re.DOTALL)
+        # Try to find anything that looks like JSON; keep only the 5 largest
+        # candidates without materializing/sorting the full candidate list
+        matches = heapq.nlargest(5, _find_json_objects(response), key=len)
 
         if not matches:
-            raise ValueError("No JSON-like structures found")
-
-        # Sort by length (longest first)
-        matches = sorted(matches, key=len, reverse=True)
+            logger.debug("Tier 3 failed: no JSON-like structures found")
+            return None
 
         last_error = None
-        for i, json_text in enumerate(matches[:5]):  # Try top 5
+        for i, json_text in enumerate(matches):
             try:
-                data = json.loads(json_text)
+                data = _loads(json_text)
 
                 # Check if it looks like ActionRecommendations
                 if 'deal_id' in data or 'p0_actions' in data:
-                    # Try to validate
-                    recommendations = ActionRecommendations(**data)
+                    # model_validate passes the dict straight to the core
+                    # validator - no **kwargs re-packing as with __init__
+                    recommendations = ActionRecommendations.model_validate(data)
 
-                    logger.warning(f"Regex fallback succeeded with match {i+1}/{min(5, len(matches))}")
+                    logger.warning(f"Regex fallback succeeded with match {i+1}/{len(matches)}")
                     return ParseResult(
                         success=True,
                         data=recommendations,
@@ -245,10 +347,13 @@ class ActionParser:
 
             except (json.JSONDecodeError, ValidationError) as e:
                 last_error = e
-                logger.debug(f"Regex match {i+1} failed: {e}")
                 continue
 
-        raise ValueError(f"Regex extraction failed - tried {min(5, len(matches))} matches. Last error: {last_error}")
+        logger.debug(
+            "Tier 3 failed: tried %d matches. Last error: %s",
+            len(matches), last_error
+        )
+        return None
 
     def validate_action_completeness(self, recommendations: ActionRecommendations) -> List[str]:
         """
@@ -281,19 +386,20 @@ class ActionParser:
                     warnings.append(f"{action_label}: No success metrics defined")
 
                 # Check action-specific requirements
-                if isinstance(action.action, EmailAction):
-                    if len(action.action.content) < 50:
-                        warnings.append(f"{action_label}: Email content too short")
-                    if len(action.action.subject) < 5:
-                        warnings.append(f"{action_label}: Email subject too short")
-
-                elif isinstance(action.action, PhoneAction):
-                    if len(action.action.talking_points) < 2:
-                        warnings.append(f"{action_label}: Phone action needs at least 2 talking points")
+                check = _COMPLETENESS_CHECKS.get(type(action.action))
+                if check:
+                    check(action, action_label, warnings)
 
         return warnings
 
 
+# Memoization for parse_recommendations: retries and reruns often re-parse
+# the identical response text. Keyed by a digest of the text rather than the
+# text itself so the cache doesn't pin multi-KB responses in memory.
+_PARSE_CACHE_MAX = 256
+_parse_cache: 'OrderedDict[Tuple[bytes, str, str], ParseResult]' = OrderedDict()
+
+
 def parse_recommendations(
     response: str,
     deal_id: str,
@@ -302,6 +408,11 @@ def parse_recommendations(
     """
     Convenience function to parse recommendations.
 
+    Successful parses are memoized on (response digest, deal_id,
+    data_version), so re-parsing an identical response is a dict lookup.
+    Repeat calls return the same ParseResult instance - treat it as
+    read-only or copy before mutating.
+
     Args:
         response: Raw AI response text
         deal_id: Deal ID for context
@@ -310,5 +421,19 @@ def parse_recommendations(
     Returns:
         ParseResult with parsed data or error
     """
-    parser = ActionParser()
-    return parser.parse(response, deal_id, data_version)
+    key = (
+        hashlib.blake2b(response.encode(), digest_size=16).digest(),
+        deal_id,
+        data_version
+    )
+    cached = _parse_cache.get(key)
+    if cached is not None:
+        _parse_cache.move_to_end(key)
+        return cached
+
+    result = ActionParser().parse(response, deal_id, data_version)
+    if result.success:
+        _parse_cache[key] = result
+        if len(_parse_cache) > _PARSE_CACHE_MAX:
+            _parse_cache.popitem(last=False)
+    return result
@@ -1,6 +1,7 @@
 """
 Utility for loading and processing prompt templates from Markdown files.
 """
+import functools
 import re
 import yaml
 from pathlib import Path
@@ -9,6 +10,67 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it; it parses
+# an order of magnitude faster than the pure-Python SafeLoader
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Compiled once at import. The negative lookahead ensures the section ends at
+# the next ## header (not ###, ####, etc.)
+_SYSTEM_PROMPT_RE = re.compile(
+    r'##\s+System Prompt\s*\n(.*?)(?=\n##(?!#)|\Z)',
+    re.DOTALL | re.IGNORECASE
+)
+
+# Handlebars-style {{#if variable}}content{{/if}} blocks
+_IF_BLOCK_RE = re.compile(r'\{\{#if\s+(\w+)\}\}(.*?)\{\{/if\}\}', re.DOTALL)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_prompt_cached(path_str: str, mtime_ns: int, size: int) -> Tuple[Dict[str, Any], str]:
+    """
+    Read and parse a prompt file, memoized on (path, mtime_ns, size).
+
+    An edited file changes the key, so stale entries miss naturally; the
+    stat metadata arguments exist purely to key the cache.
+    """
+    # read_bytes + decode skips the TextIOWrapper and universal-newline
+    # translation layer of read_text - one buffer, one decode
+    content = Path(path_str).read_bytes().decode('utf-8')
+
+    # Extract frontmatter and content
+    metadata, content_without_frontmatter = PromptLoader._extract_frontmatter(content)
+
+    # Extract the System Prompt section
+    system_prompt = PromptLoader._extract_system_prompt(content_without_frontmatter)
+
+    if not system_prompt:
+        raise ValueError(f"No '## System Prompt' section found in {path_str}")
+
+    return metadata, system_prompt
+
+
+class CompiledTemplate:
+    """
+    A prompt template pre-parsed into segments.
+
+    Each segment is (text, var_name): unconditional text when var_name is
+    None, otherwise an {{#if var}} block included only when the variable is
+    truthy. Rendering is a single pass and a join - no regex at call time.
+    """
+
+    __slots__ = ('_segments',)
+
+    def __init__(self, segments):
+        self._segments = segments
+
+    def render(self, variables: dict) -> str:
+        """Render the template against a variables dict."""
+        return "".join(
+            text
+            for text, var_name in self._segments
+            if var_name is None or variables.get(var_name)
+        )
+
 
 class PromptLoader:
     """Loads and processes prompt templates from Markdown files."""
@@ -49,16 +111,10 @@ class PromptLoader:
         if not prompt_file.exists():
             raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
 
-        content = prompt_file.read_text(encoding='utf-8')
-
-        # Extract frontmatter and content
-        metadata, content_without_frontmatter = PromptLoader._extract_frontmatter(content)
-
-        # Extract the System Prompt section
-        system_prompt = PromptLoader._extract_system_prompt(content_without_frontmatter)
-
-        if not system_prompt:
-            raise ValueError(f"No '## System Prompt' section found in {prompt_file}")
+        st = prompt_file.stat()
+        metadata, system_prompt = _load_prompt_cached(
+            str(prompt_file), st.st_mtime_ns, st.st_size
+        )
 
         logger.info(f"Loaded prompt from {prompt_file} ({len(system_prompt)} chars)")
         if metadata:
@@ -79,37 +135,46 @@ class PromptLoader:
         Returns:
             Tuple of (metadata dict, content without frontmatter)
         """
-        # Check if content starts with ---
-        if not content.strip().startswith('---'):
+        # Check if content starts with --- (tolerating leading whitespace
+        # without allocating a stripped copy of the whole file)
+        i = 0
+        n = len(content)
+        while i < n and content[i] in ' \t\n\r':
+            i += 1
+        if not content.startswith('---', i):
             return {}, content
 
-        # Find the closing ---
-        lines = content.split('\n')
-        if len(lines) < 3:
+        # Find the closing delimiter by slicing instead of splitting the
+        # whole file into a line list and re-joining both halves
+        open_end = content.find('\n', i)
+        if open_end == -1:
             return {}, content
 
-        # Find closing delimiter
-        closing_index = None
-        for i in range(1, len(lines)):
-            if lines[i].strip() == '---':
-                closing_index = i
+        close_start = content.find('\n---', open_end)
+        while close_start != -1:
+            line_end = content.find('\n', close_start + 1)
+            line = content[close_start + 1:line_end if line_end != -1 else None]
+            if line.strip() == '---':
                 break
+            close_start = content.find('\n---', close_start + 1)
 
-        if closing_index is None:
+        if close_start == -1:
             return {}, content
 
         # Extract and parse YAML
-        yaml_content = '\n'.join(lines[1:closing_index])
+        yaml_content = content[open_end + 1:close_start]
         try:
-            metadata = yaml.safe_load(yaml_content) or {}
+            metadata = yaml.load(yaml_content, Loader=_YamlLoader) or {}
         except yaml.YAMLError as e:
             logger.warning(f"Failed to parse YAML frontmatter: {e}")
             metadata = {}
 
-        # Return content without frontmatter
-        content_without_frontmatter = '\n'.join(lines[closing_index + 1:])
+        # Return content without frontmatter (skip past the closing --- line)
+        close_end = content.find('\n', close_start + 1)
+        if close_end == -1:
+            return metadata, ""
 
-        return metadata, content_without_frontmatter
+        return metadata, content[close_end + 1:]
 
     @staticmethod
     def _extract_system_prompt(content: str) -> Optional[str]:
@@ -119,12 +184,7 @@ class PromptLoader:
         Looks for content between ## System Prompt and the next ## header (not ###).
         """
         # Find the System Prompt section
-        # Use negative lookahead to ensure we only match ## (not ###, ####, etc.)
-        match = re.search(
-            r'##\s+System Prompt\s*\n(.*?)(?=\n##(?!#)|\Z)',
-            content,
-            re.DOTALL | re.IGNORECASE
-        )
+        match = _SYSTEM_PROMPT_RE.search(content)
 
         if not match:
             return None
@@ -133,6 +193,25 @@ class PromptLoader:
 
         return system_prompt
 
+    @staticmethod
+    def compile_template(prompt: str) -> CompiledTemplate:
+        """
+        Pre-parse a template's {{#if}} blocks into a CompiledTemplate.
+
+        Compile once per template, then CompiledTemplate.render per call -
+        the regex scan happens only at compile time.
+        """
+        segments = []
+        pos = 0
+        for match in _IF_BLOCK_RE.finditer(prompt):
+            if match.start() > pos:
+                segments.append((prompt[pos:match.start()], None))
+            segments.append((match.group(2), match.group(1)))
+            pos = match.end()
+        if pos < len(prompt):
+            segments.append((prompt[pos:], None))
+        return CompiledTemplate(segments)
+
     @staticmethod
     def process_template_variables(
         prompt: str,
@@ -162,9 +241,7 @@ class PromptLoader:
             else:
                 return ""
 
-        # Pattern: {{#if variable}}content{{/if}}
-        pattern = r'\{\{#if\s+(\w+)\}\}(.*?)\{\{/if\}\}'
-        result = re.sub(pattern, replace_if_block, prompt, flags=re.DOTALL)
+        result = _IF_BLOCK_RE.sub(replace_if_block, prompt)
 
         return result
 
@@ -3,7 +3,7 @@ AI client for Claude API integration.
 """
 import json
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import anthropic
 from pydantic import BaseModel
 
@@ -13,6 +13,14 @@ logger = logging.getLogger(__name__)
 class AIClient:
     """Client for interacting with Claude API."""
 
+    # One anthropic.Anthropic (and its httpx connection pool) per API key,
+    # shared across AIClient instances: reusing the pool amortizes TCP + TLS
+    # setup across calls. The SDK client is thread-safe.
+    _clients: Dict[str, anthropic.Anthropic] = {}
+
+    # Async counterparts, created lazily on first agenerate_completion call
+    _async_clients: Dict[str, anthropic.AsyncAnthropic] = {}
+
     def __init__(
         self,
         api_key: str,
@@ -29,7 +37,13 @@ class AIClient:
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature (0-1)
         """
-        self.client = anthropic.Anthropic(api_key=api_key)
+        client = AIClient._clients.get(api_key)
+        if client is None:
+            client = AIClient._clients.setdefault(
+                api_key, anthropic.Anthropic(api_key=api_key)
+            )
+        self.client = client
+        self._api_key = api_key
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
@@ -37,17 +51,23 @@ class AIClient:
     def generate_completion(
         self,
         system_prompt: str,
-        user_prompt: str,
-        response_format: Optional[type[BaseModel] | Dict[str, str]] = None
+        user_prompt: str | List[Dict[str, Any]],
+        response_format: Optional[type[BaseModel] | Dict[str, str]] = None,
+        stream: bool = False
     ) -> Dict[str, Any]:
         """
         Generate completion from Claude.
 
         Args:
             system_prompt: System instructions
-            user_prompt: User message/prompt
+            user_prompt: User message - either a plain string or a list of
+                         content blocks (e.g. to set cache_control breakpoints
+                         on a static prefix block)
             response_format: Optional Pydantic model for structured output,
                            or dict like {"type": "json_object"} for Claude JSON mode
+            stream: If True, consume the response via the streaming API -
+                    preferable for long generations (no single long-poll
+                    request to time out, text arrives incrementally)
 
         Returns:
             Dict containing the response
@@ -55,22 +75,101 @@ class AIClient:
         try:
             logger.info(f"Calling Claude API with model: {self.model}")
             logger.debug(f"System prompt length: {len(system_prompt)} chars")
-            logger.debug(f"User prompt length: {len(user_prompt)} chars")
 
             messages = [
                 {"role": "user", "content": user_prompt}
             ]
 
-            # Call Claude API
-            response = self.client.messages.create(
+            # Mark the system prompt as a cache breakpoint: it is the large
+            # static prefix (company context + template) shared across deals,
+            # so Anthropic's prompt caching can reuse it between requests
+            system_blocks = [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"}
+                }
+            ]
+
+            if stream:
+                # Stream and accumulate: chunks arrive as generated instead
+                # of blocking on one long request for the full completion
+                chunks = []
+                with self.client.messages.stream(
+                    model=self.model,
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature,
+                    system=system_blocks,
+                    messages=messages
+                ) as response_stream:
+                    for text in response_stream.text_stream:
+                        chunks.append(text)
+                response_text = "".join(chunks)
+            else:
+                # Call Claude API
+                response = self.client.messages.create(
+                    model=self.model,
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature,
+                    system=system_blocks,
+                    messages=messages
+                )
+
+                # Extract text content
+                response_text = ""
+                for block in response.content:
+                    if hasattr(block, 'text'):
+                        response_text += block.text
+
+            logger.info(f"Received response ({len(response_text)} chars)")
+
+            return self._postprocess_response(response_text, response_format)
+
+        except anthropic.APIError as e:
+            logger.error(f"Claude API error: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error calling Claude: {e}")
+            raise
+
+    async def agenerate_completion(
+        self,
+        system_prompt: str,
+        user_prompt: str | List[Dict[str, Any]],
+        response_format: Optional[type[BaseModel] | Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of generate_completion.
+
+        Same arguments and return shape; uses a shared AsyncAnthropic client
+        so many completions can be awaited concurrently (e.g. batch
+        summarization with asyncio.gather).
+        """
+        client = AIClient._async_clients.get(self._api_key)
+        if client is None:
+            client = AIClient._async_clients.setdefault(
+                self._api_key, anthropic.AsyncAnthropic(api_key=self._api_key)
+            )
+
+        try:
+            logger.info(f"Calling Claude API (async) with model: {self.model}")
+
+            system_blocks = [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"}
+                }
+            ]
+
+            response = await client.messages.create(
                 model=self.model,
                 max_tokens=self.max_tokens,
                 temperature=self.temperature,
-                system=system_prompt,
-                messages=messages
+                system=system_blocks,
+                messages=[{"role": "user", "content": user_prompt}]
             )
 
-            # Extract text content
             response_text = ""
             for block in response.content:
                 if hasattr(block, 'text'):
@@ -78,29 +177,7 @@ class AIClient:
 
             logger.info(f"Received response ({len(response_text)} chars)")
 
-            # Parse response if format specified
-            if response_format:
-                # Handle dict format (e.g., {"type": "json_object"})
-                if isinstance(response_format, dict):
-                    # Just return raw response for JSON mode
-                    # Parser will handle the three-tier strategy
-                    return {"response": response_text}
-
-                # Handle Pydantic model format
-                try:
-                    # Try to extract JSON from response
-                    # Look for JSON in markdown code blocks or raw JSON
-                    json_text = self._extract_json(response_text)
-                    parsed_data = json.loads(json_text)
-                    validated_data = response_format(**parsed_data)
-                    return validated_data.dict()
-                except Exception as e:
-                    logger.warning(f"Could not parse structured response: {e}")
-                    logger.debug(f"Raw response: {response_text[:500]}...")
-                    # Return raw response if parsing fails
-                    return {"raw_response": response_text, "parse_error": str(e)}
-
-            return {"response": response_text}
+            return self._postprocess_response(response_text, response_format)
 
         except anthropic.APIError as e:
             logger.error(f"Claude API error: {e}")
@@ -109,6 +186,36 @@ class AIClient:
             logger.error(f"Unexpected error calling Claude: {e}")
             raise
 
+    def _postprocess_response(
+        self,
+        response_text: str,
+        response_format: Optional[type[BaseModel] | Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """Shape the raw response text according to response_format."""
+        # Parse response if format specified
+        if response_format:
+            # Handle dict format (e.g., {"type": "json_object"})
+            if isinstance(response_format, dict):
+                # Just return raw response for JSON mode
+                # Parser will handle the three-tier strategy
+                return {"response": response_text}
+
+            # Handle Pydantic model format
+            try:
+                # Try to extract JSON from response
+                # Look for JSON in markdown code blocks or raw JSON
+                json_text = self._extract_json(response_text)
+                parsed_data = json.loads(json_text)
+                validated_data = response_format(**parsed_data)
+                return validated_data.model_dump(mode='json')
+            except Exception as e:
+                logger.warning(f"Could not parse structured response: {e}")
+                logger.debug(f"Raw response: {response_text[:500]}...")
+                # Return raw response if parsing fails
+                return {"raw_response": response_text, "parse_error": str(e)}
+
+        return {"response": response_text}
+
     def _extract_json(self, text: str) -> str:
         """
         Extract JSON from text that might contain markdown code blocks.
@@ -119,23 +226,32 @@ class AIClient:
         Returns:
             Extracted JSON string
         """
-        # Try to find JSON in markdown code blocks
-        if "```json" in text:
-            start = text.find("```json") + 7
+        # Fast path: the whole response is already raw JSON
+        stripped = text.strip()
+        if stripped[:1] in ('{', '['):
+            return stripped
+
+        # Single scan per delimiter: compute each fence index once instead
+        # of an 'in' membership scan followed by a find of the same pattern
+        start = text.find("```json")
+        if start != -1:
+            start += 7
             end = text.find("```", start)
             if end != -1:
                 return text[start:end].strip()
-        elif "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
-            if end != -1:
-                json_candidate = text[start:end].strip()
-                # Check if it looks like JSON
-                if json_candidate.startswith('{') or json_candidate.startswith('['):
-                    return json_candidate
+        else:
+            start = text.find("```")
+            if start != -1:
+                start += 3
+                end = text.find("```", start)
+                if end != -1:
+                    json_candidate = text[start:end].strip()
+                    # Check if it looks like JSON
+                    if json_candidate[:1] in ('{', '['):
+                        return json_candidate
 
         # Otherwise return the full text (might be raw JSON)
-        return text.strip()
+        return stripped
 
     def estimate_tokens(self, text: str) -> int:
         """
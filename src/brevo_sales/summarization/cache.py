@@ -8,12 +8,16 @@ import json
 import hashlib
 import sqlite3
 import logging
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Entries kept in the per-instance in-memory tier before LRU eviction
+_MEM_CACHE_MAX = 256
+
 
 class SummaryCache:
     """
@@ -37,8 +41,20 @@ class SummaryCache:
         self.cache_file = Path(cache_file)
         self.cache_file.parent.mkdir(parents=True, exist_ok=True)
         self.ttl_hours = ttl_hours
+        # In-memory tier over the SQLite store: repeated lookups for the
+        # same (cache_key, data_hash) within a process skip the disk read
+        # and JSON parse. LRU-bounded; freshness is still re-checked per
+        # lookup from the stored generation time.
+        self._mem: OrderedDict[Tuple[str, str], Tuple[Any, datetime]] = OrderedDict()
         self._init_db()
 
+    def _mem_put(self, mem_key: Tuple[str, str], summary: Any, generated_at: datetime):
+        """Insert into the in-memory tier, evicting the LRU entry if full."""
+        self._mem[mem_key] = (summary, generated_at)
+        self._mem.move_to_end(mem_key)
+        if len(self._mem) > _MEM_CACHE_MAX:
+            self._mem.popitem(last=False)
+
     def _init_db(self):
         """Initialize cache database."""
         with sqlite3.connect(self.cache_file) as conn:
@@ -175,6 +191,24 @@ class SummaryCache:
         cache_key = self._get_cache_key(enriched_data, prompt_hash)
         data_hash = self._compute_data_hash(enriched_data)
 
+        # In-memory tier: same key and unchanged data within this process
+        mem_key = (cache_key, data_hash)
+        entry = self._mem.get(mem_key)
+        if entry is not None:
+            summary, generated_at = entry
+            if datetime.now() - generated_at < timedelta(hours=self.ttl_hours):
+                if isinstance(summary, str):
+                    # Stored pre-serialized by save_summary; parse lazily on
+                    # first hit and keep the parsed form
+                    summary = json.loads(summary)
+                self._mem[mem_key] = (summary, generated_at)
+                self._mem.move_to_end(mem_key)
+                logger.info(f"Using fresh in-memory cached summary for {cache_key}")
+                return (summary, True, None)
+            # Went stale in-process; the disk path below still has the
+            # previous enriched data needed for diff computation
+            del self._mem[mem_key]
+
         try:
             with sqlite3.connect(self.cache_file) as conn:
                 conn.row_factory = sqlite3.Row
@@ -211,6 +245,7 @@ class SummaryCache:
                 # Return cached summary only if data unchanged AND fresh
                 if data_unchanged and is_fresh:
                     logger.info("Using fresh cached summary")
+                    self._mem_put(mem_key, cached_summary, generated_at)
                     return (cached_summary, True, None)
                 else:
                     # Return previous data for diff computation
@@ -224,7 +259,7 @@ class SummaryCache:
     def save_summary(
         self,
         enriched_data: Dict[str, Any],
-        summary: Dict[str, Any],
+        summary: Union[Dict[str, Any], str],
         prompt_template: str
     ):
         """
@@ -232,13 +267,16 @@ class SummaryCache:
 
         Args:
             enriched_data: Enriched CRM data used for generation
-            summary: Generated summary
+            summary: Generated summary, either as a dict or already
+                     serialized to a JSON string (e.g. model_dump_json())
             prompt_template: Prompt template used for generation
         """
         prompt_hash = self._compute_prompt_hash(prompt_template)
         cache_key = self._get_cache_key(enriched_data, prompt_hash)
         data_hash = self._compute_data_hash(enriched_data)
 
+        generated_at = datetime.now()
+
         try:
             with sqlite3.connect(self.cache_file) as conn:
                 # Insert or replace
@@ -251,12 +289,16 @@ class SummaryCache:
                     data_hash,
                     prompt_hash,
                     json.dumps(enriched_data),
-                    json.dumps(summary),
-                    datetime.now().isoformat()
+                    summary if isinstance(summary, str) else json.dumps(summary),
+                    generated_at.isoformat()
                 ))
                 conn.commit()
                 logger.info(f"Saved summary to cache: {cache_key}")
 
+            # Populate the in-memory tier so re-lookups in this process hit
+            # without touching disk; a JSON string is parsed lazily on hit
+            self._mem_put((cache_key, data_hash), summary, generated_at)
+
         except Exception as e:
             logger.error(f"Error saving to cache: {e}")
 
@@ -267,6 +309,12 @@ class SummaryCache:
         Args:
             cache_key: Specific cache key to clear, or None to clear all
         """
+        if cache_key:
+            for mem_key in [k for k in self._mem if k[0] == cache_key]:
+                del self._mem[mem_key]
+        else:
+            self._mem.clear()
+
         try:
             with sqlite3.connect(self.cache_file) as conn:
                 if cache_key:
@@ -1,6 +1,7 @@
 """
 Utility for loading and processing prompt templates from Markdown files.
 """
+import functools
 import re
 from pathlib import Path
 from typing import Optional
@@ -8,6 +9,37 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import - matches the ## System Prompt section up to the
+# next ## header or end of file
+_SYSTEM_PROMPT_RE = re.compile(
+    r'##\s+System Prompt\s*\n(.*?)(?=\n##|\Z)',
+    re.DOTALL | re.IGNORECASE
+)
+
+# Handlebars-style {{#if variable}}content{{/if}} blocks
+_IF_BLOCK_RE = re.compile(r'\{\{#if\s+(\w+)\}\}(.*?)\{\{/if\}\}', re.DOTALL)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_prompt_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """
+    Read and parse a prompt file, memoized on (path, mtime_ns, size).
+
+    An edited file changes the key, so stale entries miss naturally; the
+    stat metadata arguments exist purely to key the cache.
+    """
+    # read_bytes + decode skips the TextIOWrapper and universal-newline
+    # translation layer of read_text - one buffer, one decode
+    content = Path(path_str).read_bytes().decode('utf-8')
+
+    # Extract the System Prompt section
+    system_prompt = PromptLoader._extract_system_prompt(content)
+
+    if not system_prompt:
+        raise ValueError(f"No '## System Prompt' section found in {path_str}")
+
+    return system_prompt
+
 
 class PromptLoader:
     """Loads and processes prompt templates from Markdown files."""
@@ -30,13 +62,8 @@ class PromptLoader:
         if not prompt_file.exists():
             raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
 
-        content = prompt_file.read_text(encoding='utf-8')
-
-        # Extract the System Prompt section
-        system_prompt = PromptLoader._extract_system_prompt(content)
-
-        if not system_prompt:
-            raise ValueError(f"No '## System Prompt' section found in {prompt_file}")
+        st = prompt_file.stat()
+        system_prompt = _load_prompt_cached(str(prompt_file), st.st_mtime_ns, st.st_size)
 
         logger.info(f"Loaded prompt from {prompt_file} ({len(system_prompt)} chars)")
 
@@ -50,11 +77,7 @@ class PromptLoader:
         Looks for content between ## System Prompt and the next ## header.
         """
         # Find the System Prompt section
-        match = re.search(
-            r'##\s+System Prompt\s*\n(.*?)(?=\n##|\Z)',
-            content,
-            re.DOTALL | re.IGNORECASE
-        )
+        match = _SYSTEM_PROMPT_RE.search(content)
 
         if not match:
             return None
@@ -92,9 +115,7 @@ class PromptLoader:
             else:
                 return ""
 
-        # Pattern: {{#if variable}}content{{/if}}
-        pattern = r'\{\{#if\s+(\w+)\}\}(.*?)\{\{/if\}\}'
-        result = re.sub(pattern, replace_if_block, prompt, flags=re.DOTALL)
+        result = _IF_BLOCK_RE.sub(replace_if_block, prompt)
 
         return result
 
@@ -1,21 +1,158 @@
 """
 Deal summarization logic using AI.
 """
+import asyncio
+import functools
+import io
 import json
 import logging
 import hashlib
+import re
 from typing import Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
 
 from brevo_sales.summarization.ai_client import AIClient
-from brevo_sales.summarization.models import DealSummary
+from brevo_sales.summarization.models import (
+    DealSummary,
+    InteractionSummary,
+    KeyInsight,
+    Stakeholder,
+)
 from brevo_sales.summarization.cache import SummaryCache
 from brevo_sales.summarization.diff import compute_enriched_data_diff, format_diff_for_ai
 from brevo_sales.summarization.prompt_loader import PromptLoader
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import - used per note in every summary build
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Maximal runs of HTML tags and/or whitespace, replaced in a single pass by
+# _clean_note_text instead of a tag-stripping sub followed by a
+# whitespace-collapsing sub over the same text
+_NOTE_CLEAN_RE = re.compile(r'(?:<[^>]+>|\s+)+')
+
+
+def _clean_note_text(text: str) -> str:
+    """Strip HTML tags and collapse whitespace in one scan.
+
+    A run collapses to a single space when it contains whitespace outside
+    the tags themselves and vanishes when it is tags only - the same result
+    as stripping tags first and collapsing whitespace second, without the
+    second pass over the text.
+    """
+    return _NOTE_CLEAN_RE.sub(
+        lambda m: ' ' if _HTML_TAG_RE.sub('', m.group()) else '',
+        text
+    ).strip()
+
+# Optional: orjson emits UTF-8 bytes directly from C - much faster than
+# json.dumps + encode over the large nested enriched_data payloads hashed on
+# every summarize() call. No key sorting: enriched_data comes from pydantic
+# model_dump, whose key order is fixed by the model definition, so insertion
+# order is already deterministic and per-level sorting would be pure waste.
+# Without orjson, stream the stdlib encoder's chunks straight into the hash
+# so the full serialized payload never exists in memory at once.
+try:
+    import orjson
+
+    def _fingerprint(data: Any) -> str:
+        return hashlib.blake2b(orjson.dumps(data), digest_size=8).hexdigest()
+except ImportError:
+    _CANONICAL_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+    def _fingerprint(data: Any) -> str:
+        h = hashlib.blake2b(digest_size=8)
+        for chunk in _CANONICAL_ENCODER.iterencode(data):
+            h.update(chunk.encode())
+        return h.hexdigest()
+
+
+# Nested list fields of DealSummary and the model each item belongs to -
+# used to rebuild a cached summary without re-running validation
+_NESTED_SUMMARY_FIELDS = (
+    ("stakeholders", Stakeholder),
+    ("opportunities", KeyInsight),
+    ("risks", KeyInsight),
+    ("requirements", KeyInsight),
+    ("recent_interactions", InteractionSummary),
+)
+
+
+def _construct_cached_summary(cached_summary: Dict[str, Any]) -> DealSummary:
+    """
+    Rebuild a DealSummary from a cache payload without validation.
+
+    The payload was validated when it was saved, so model_construct is safe
+    here and skips the field validators (email-to-name fallbacks, shape
+    coercions) that full validation would re-run on every cache hit. Nested
+    lists are constructed explicitly because model_construct does not
+    recurse into them.
+    """
+    data = dict(cached_summary)
+    for field, model in _NESTED_SUMMARY_FIELDS:
+        items = data.get(field)
+        if items:
+            data[field] = [model.model_construct(**item) for item in items]
+    return DealSummary.model_construct(**data)
+
+
+@functools.lru_cache(maxsize=4096)
+def _render_contact(email, prenom, nom, company_name, created) -> str:
+    """Render one contact fragment, memoized on its relevant fields."""
+    parts = [f"**Contact:** {email}"]
+
+    if prenom or nom:
+        name = f"{prenom} {nom}".strip()
+        if name:
+            parts.append(f"- Name: {name}")
+
+    if company_name:
+        parts.append(f"- Company: {company_name}")
+
+    if created:
+        parts.append(f"- Created: {created}")
+
+    return "\n".join(parts) + "\n\n"
+
+
+@functools.lru_cache(maxsize=4096)
+def _render_company(name, domain, industry, linked_contacts) -> str:
+    """Render one company fragment, memoized on its relevant fields."""
+    parts = [f"**Company:** {name}"]
+
+    if domain:
+        parts.append(f"- Domain: {domain}")
+
+    if industry:
+        parts.append(f"- Industry: {industry}")
+
+    if linked_contacts:
+        parts.append(f"- Linked Contacts: {linked_contacts}")
+
+    return "\n".join(parts) + "\n\n"
+
+
+@functools.lru_cache(maxsize=4096)
+def _render_deal(deal_name, stage_name, deal_value, linked_contacts, linked_companies) -> str:
+    """Render one deal fragment, memoized on its relevant fields."""
+    parts = [f"**Deal:** {deal_name}"]
+
+    if stage_name:
+        parts.append(f"- Stage: {stage_name}")
+
+    if deal_value:
+        parts.append(f"- Value: {deal_value}")
+
+    if linked_contacts:
+        parts.append(f"- Linked Contacts: {linked_contacts}")
+
+    if linked_companies:
+        parts.append(f"- Linked Companies: {linked_companies}")
+
+    return "\n".join(parts) + "\n\n"
+
 
 class DealSummarizer:
     """Generates AI-powered deal summaries from enriched data with intelligent caching."""
@@ -38,11 +175,16 @@ class DealSummarizer:
         self.cache = cache
         self.prompt_template = prompt_template or PromptLoader.load_default_prompt()
 
+        # The template has exactly one variable (with_change_analysis), so
+        # only two rendered variants ever exist - memoize both
+        self._rendered_system_prompts: Dict[bool, str] = {}
+
     def summarize(
         self,
         enriched_data: Dict[str, Any],
         focus_areas: Optional[list[str]] = None,
-        force_refresh: bool = False
+        force_refresh: bool = False,
+        generated_at: Optional[datetime] = None
     ) -> DealSummary:
         """
         Generate comprehensive deal summary from enriched data with intelligent caching.
@@ -56,6 +198,8 @@ class DealSummarizer:
             enriched_data: Output from Script 1 (brevo_data_gatherer)
             focus_areas: Optional list of areas to focus on
             force_refresh: Force regeneration even if cache is fresh
+            generated_at: Optional timestamp to stamp the summary with -
+                          batch callers pass one run timestamp for all deals
 
         Returns:
             DealSummary object
@@ -66,63 +210,272 @@ class DealSummarizer:
         data_hash = self._compute_data_hash(enriched_data)
 
         # Check cache if enabled
-        previous_summary = None
-        previous_enriched = None
-        diff = None
+        fresh_summary, previous_summary, diff = self._check_cache(enriched_data, force_refresh)
+        if fresh_summary is not None:
+            return fresh_summary
 
-        if self.cache and not force_refresh:
-            cache_result = self.cache.get_cached_summary(enriched_data, self.prompt_template)
+        # Build prompts (including diff if available)
+        system_prompt, user_prompt = self._prepare_prompts(
+            enriched_data, focus_areas, previous_summary, diff
+        )
 
-            if cache_result:
-                cached_summary, is_fresh, prev_enriched = cache_result
+        # Generate summary using Claude (Markdown output)
+        response = self.ai_client.generate_completion(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            response_format=None  # No structured output, use Markdown
+        )
 
-                if is_fresh:
-                    # Return cached summary
-                    logger.info("Using fresh cached summary")
-                    summary = DealSummary(**cached_summary)
-                    summary.is_cached = True
-                    return summary
+        # Extract markdown text
+        markdown_text = response.get("response", "")
 
-                # Cache exists but stale or data changed - prepare diff
-                logger.info("Cache found but stale/changed, computing diff")
-                previous_summary = cached_summary
-                previous_enriched = prev_enriched
+        if not markdown_text:
+            logger.warning("Empty response from Claude")
+            return self._build_fallback_summary(enriched_data, "Empty response")
 
-                # Compute diff for AI analysis
-                if previous_enriched:
-                    diff = compute_enriched_data_diff(previous_enriched, enriched_data)
-                    logger.info(f"Computed diff: {len(diff.get('summary', []))} changes")
+        logger.info("Successfully generated markdown summary (%d chars)", len(markdown_text))
 
-        # Build prompts (including diff if available)
-        system_prompt = self._build_system_prompt(with_change_analysis=bool(diff))
-        user_prompt = self._build_user_prompt(
-            enriched_data,
-            focus_areas,
-            previous_summary=previous_summary,
-            diff=diff
+        summary = self._finalize_summary(
+            markdown_text, enriched_data, data_hash, previous_summary, generated_at
         )
 
-        # Generate summary using Claude (Markdown output)
-        response = self.ai_client.generate_completion(
+        # Save to cache if enabled. model_dump_json serializes straight from
+        # the model - no deep-copied dict intermediate as with .dict()
+        if self.cache:
+            self.cache.save_summary(
+                enriched_data, summary.model_dump_json(), self.prompt_template
+            )
+            logger.info("Saved summary to cache")
+
+        return summary
+
+    async def asummarize(
+        self,
+        enriched_data: Dict[str, Any],
+        focus_areas: Optional[list[str]] = None,
+        force_refresh: bool = False,
+        generated_at: Optional[datetime] = None
+    ) -> DealSummary:
+        """
+        Async counterpart of summarize().
+
+        Awaits the Claude call and runs cache I/O in worker threads, so many
+        summaries can be generated concurrently (see summarize_many).
+        """
+        logger.info("Starting deal summarization (async)")
+
+        data_hash = self._compute_data_hash(enriched_data)
+
+        fresh_summary, previous_summary, diff = await asyncio.to_thread(
+            self._check_cache, enriched_data, force_refresh
+        )
+        if fresh_summary is not None:
+            return fresh_summary
+
+        system_prompt, user_prompt = self._prepare_prompts(
+            enriched_data, focus_areas, previous_summary, diff
+        )
+
+        response = await self.ai_client.agenerate_completion(
             system_prompt=system_prompt,
             user_prompt=user_prompt,
             response_format=None  # No structured output, use Markdown
         )
 
-        # Extract markdown text
         markdown_text = response.get("response", "")
 
         if not markdown_text:
             logger.warning("Empty response from Claude")
             return self._build_fallback_summary(enriched_data, "Empty response")
 
-        logger.info(f"Successfully generated markdown summary ({len(markdown_text)} chars)")
+        logger.info("Successfully generated markdown summary (%d chars)", len(markdown_text))
+
+        summary = self._finalize_summary(
+            markdown_text, enriched_data, data_hash, previous_summary, generated_at
+        )
+
+        if self.cache:
+            await asyncio.to_thread(
+                self.cache.save_summary,
+                enriched_data, summary.model_dump_json(), self.prompt_template
+            )
+            logger.info("Saved summary to cache")
+
+        return summary
+
+    async def summarize_many(
+        self,
+        items: list[Dict[str, Any]],
+        concurrency: int = 8,
+        force_refresh: bool = False
+    ) -> list[DealSummary]:
+        """
+        Summarize many deals concurrently.
+
+        The workload is network-bound, so issuing the Claude calls in
+        parallel turns N serial round-trips into roughly one. Concurrency is
+        bounded with a semaphore to stay within API rate limits.
+
+        Args:
+            items: List of enriched_data payloads
+            concurrency: Maximum in-flight summarizations
+            force_refresh: Force regeneration even if caches are fresh
+
+        Returns:
+            List of DealSummary objects, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        # One wall-clock read for the whole batch: every summary carries the
+        # same run timestamp instead of N clock reads and string allocs
+        run_timestamp = datetime.now()
+
+        async def run(enriched_data: Dict[str, Any]) -> DealSummary:
+            async with semaphore:
+                return await self.asummarize(
+                    enriched_data,
+                    force_refresh=force_refresh,
+                    generated_at=run_timestamp
+                )
+
+        return list(await asyncio.gather(*(run(item) for item in items)))
+
+    # A stale-cache regeneration with at most this many changes is treated
+    # as a delta update: only the previous summary and the diff are sent
+    _INCREMENTAL_DIFF_THRESHOLD = 20
+
+    def _prepare_prompts(
+        self,
+        enriched_data: Dict[str, Any],
+        focus_areas: Optional[list[str]],
+        previous_summary: Optional[Dict[str, Any]],
+        diff: Optional[Dict[str, Any]]
+    ) -> tuple:
+        """
+        Choose between the full and incremental prompt paths.
+
+        Returns:
+            Tuple of (system_prompt, user_prompt)
+        """
+        system_prompt = self._build_system_prompt(with_change_analysis=bool(diff))
+
+        if (
+            previous_summary
+            and diff
+            and len(diff.get("summary", [])) <= self._INCREMENTAL_DIFF_THRESHOLD
+        ):
+            logger.info("Small diff - using incremental summary prompt")
+            user_prompt = self._build_incremental_prompt(previous_summary, diff, focus_areas)
+        else:
+            user_prompt = self._build_user_prompt(
+                enriched_data,
+                focus_areas,
+                previous_summary=previous_summary,
+                diff=diff
+            )
+
+        return system_prompt, user_prompt
+
+    def _build_incremental_prompt(
+        self,
+        previous_summary: Dict[str, Any],
+        diff: Dict[str, Any],
+        focus_areas: Optional[list[str]] = None
+    ) -> list[Dict[str, Any]]:
+        """
+        Build a delta-update prompt: previous summary plus diff only.
+
+        When little has changed since the cached summary, re-sending the
+        full enriched payload wastes most of the input tokens - the previous
+        summary already encodes it. The stable previous summary is the
+        cacheable prefix block; the diff trails.
+        """
+        buf = io.StringIO()
+        w = buf.write
+
+        w("# CRM Summary Update Request - INCREMENTAL\n\n")
+        w("**A summary for this deal already exists. Update it to reflect the changes listed below, keeping everything still accurate unchanged.**\n")
+
+        w("\n## Previous Summary\n")
+        w(f"**Generated:** {previous_summary.get('generated_at', 'Unknown')}\n\n")
+        w(previous_summary.get('executive_summary', 'N/A'))
+        w("\n")
+
+        dynamic = io.StringIO()
+        dw = dynamic.write
+
+        dw("\n")
+        dw(format_diff_for_ai(diff))
+
+        if focus_areas:
+            dw(f"\n**Focus on these areas:** {', '.join(focus_areas)}\n")
+
+        dw("\n\n---\n")
+        dw("**Please produce the complete updated deal summary in Markdown format following the specified structure.**")
+
+        return [
+            {
+                "type": "text",
+                "text": buf.getvalue(),
+                "cache_control": {"type": "ephemeral"}
+            },
+            {
+                "type": "text",
+                "text": dynamic.getvalue()
+            },
+        ]
+
+    def _check_cache(
+        self,
+        enriched_data: Dict[str, Any],
+        force_refresh: bool
+    ) -> tuple:
+        """
+        Consult the summary cache.
+
+        Returns:
+            Tuple of (fresh DealSummary or None, previous_summary, diff)
+        """
+        if not self.cache or force_refresh:
+            return None, None, None
+
+        cache_result = self.cache.get_cached_summary(enriched_data, self.prompt_template)
+        if not cache_result:
+            return None, None, None
+
+        cached_summary, is_fresh, previous_enriched = cache_result
+
+        if is_fresh:
+            # Return cached summary - skip re-validation, the payload was
+            # validated before it went into the cache
+            logger.info("Using fresh cached summary")
+            summary = _construct_cached_summary(cached_summary)
+            summary.is_cached = True
+            return summary, None, None
+
+        # Cache exists but stale or data changed - prepare diff
+        logger.info("Cache found but stale/changed, computing diff")
+        diff = None
+        if previous_enriched:
+            diff = compute_enriched_data_diff(previous_enriched, enriched_data)
+            logger.info("Computed diff: %d changes", len(diff.get('summary', [])))
+
+        return None, cached_summary, diff
+
+    def _finalize_summary(
+        self,
+        markdown_text: str,
+        enriched_data: Dict[str, Any],
+        data_hash: str,
+        previous_summary: Optional[Dict[str, Any]],
+        generated_at: Optional[datetime] = None
+    ) -> DealSummary:
+        """Build the DealSummary object from generated markdown."""
+        deal_name, deal_id, company_name = self._extract_core_fields(enriched_data)
 
-        # Create summary object with markdown
         summary_data = {
-            "deal_name": self._extract_deal_name(enriched_data),
-            "deal_id": self._extract_deal_id(enriched_data),
-            "company_name": self._extract_company_name(enriched_data),
+            "deal_name": deal_name,
+            "deal_id": deal_id,
+            "company_name": company_name,
             "deal_stage": None,
             "deal_value": None,
             "executive_summary": markdown_text,  # Store full markdown
@@ -134,7 +487,7 @@ class DealSummarizer:
             "recent_interactions": [],
             "current_status": "",
             "next_steps_context": "",
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": (generated_at or datetime.now()).isoformat(),
             "data_sources": ["Script 1 enriched data"],
             "confidence_score": 1.0,
             "data_version": data_hash,
@@ -143,19 +496,12 @@ class DealSummarizer:
             "changes_since_last_summary": None
         }
 
-        summary = DealSummary(**summary_data)
-
-        # Save to cache if enabled
-        if self.cache:
-            self.cache.save_summary(enriched_data, summary.dict(), self.prompt_template)
-            logger.info("Saved summary to cache")
-
-        return summary
+        return DealSummary(**summary_data)
 
     def _compute_data_hash(self, enriched_data: Dict[str, Any]) -> str:
-        """Compute hash of enriched data."""
-        data_str = json.dumps(enriched_data, sort_keys=True)
-        return hashlib.sha256(data_str.encode()).hexdigest()[:16]
+        """Compute a 16-hex-char version fingerprint of enriched data."""
+        # Change-detection token only, no cryptographic requirement
+        return _fingerprint(enriched_data)
 
     def _build_system_prompt(self, with_change_analysis: bool = False) -> str:
         """
@@ -164,11 +510,14 @@ class DealSummarizer:
         Args:
             with_change_analysis: Whether to include change analysis capabilities
         """
-        # Process template variables
-        prompt = PromptLoader.process_template_variables(
-            self.prompt_template,
-            {"with_change_analysis": with_change_analysis}
-        )
+        prompt = self._rendered_system_prompts.get(with_change_analysis)
+        if prompt is None:
+            # Process template variables
+            prompt = PromptLoader.process_template_variables(
+                self.prompt_template,
+                {"with_change_analysis": with_change_analysis}
+            )
+            self._rendered_system_prompts[with_change_analysis] = prompt
 
         return prompt
 
@@ -178,9 +527,14 @@ class DealSummarizer:
         focus_areas: Optional[list[str]] = None,
         previous_summary: Optional[Dict[str, Any]] = None,
         diff: Optional[Dict[str, Any]] = None
-    ) -> str:
+    ) -> list[Dict[str, Any]]:
         """
-        Build the user prompt with enriched data.
+        Build the user message as content blocks.
+
+        The first block holds the enriched-data dump, which is stable between
+        refreshes, and carries a cache_control breakpoint so regenerations of
+        the same deal reuse the cached prefix; the per-call context (previous
+        summary, diff, focus areas, instruction) trails in a second block.
 
         Args:
             enriched_data: Enriched CRM data from Script 1
@@ -189,7 +543,7 @@ class DealSummarizer:
             diff: Diff between previous and current data
 
         Returns:
-            Formatted prompt string
+            List of content blocks for the user message
         """
         # Extract key components
         primary_type = enriched_data.get("primary_type", "unknown")
@@ -197,34 +551,17 @@ class DealSummarizer:
         related_entities = enriched_data.get("related_entities", {})
         interaction_history = enriched_data.get("interaction_history", {})
 
-        prompt_parts = []
+        # Single growable buffer: formatters write lines straight into it
+        # instead of each returning a joined string to append and re-join
+        buf = io.StringIO()
+        w = buf.write
 
         # Header
-        if previous_summary and diff:
-            prompt_parts.append("# CRM Data Analysis Request - UPDATE\n")
-            prompt_parts.append("**This is an update to a previous summary. Data has changed or sufficient time has passed.**\n")
-        else:
-            prompt_parts.append("# CRM Data Analysis Request\n")
-
-        # Include previous summary context if available
-        if previous_summary:
-            prompt_parts.append("\n## Previous Summary Context\n")
-            prompt_parts.append(f"**Generated:** {previous_summary.get('generated_at', 'Unknown')}\n")
-            prompt_parts.append(f"**Executive Summary:** {previous_summary.get('executive_summary', 'N/A')}\n")
-            if previous_summary.get('current_status'):
-                prompt_parts.append(f"**Previous Status:** {previous_summary.get('current_status')}\n")
-
-        # Include diff if available
-        if diff:
-            prompt_parts.append("\n" + format_diff_for_ai(diff))
-
-        # Focus areas if specified
-        if focus_areas:
-            prompt_parts.append(f"\n**Focus on these areas:** {', '.join(focus_areas)}\n")
+        w("# CRM Data Analysis Request\n\n")
 
         # Primary entity info
-        prompt_parts.append(f"## Primary Entity: {primary_type.title()}\n")
-        prompt_parts.append(self._format_primary_entity(primary_type, primary_record))
+        w(f"## Primary Entity: {primary_type.title()}\n\n")
+        self._format_primary_entity(primary_type, primary_record, w)
 
         # Related entities
         contacts = related_entities.get("contacts", [])
@@ -232,179 +569,189 @@ class DealSummarizer:
         deals = related_entities.get("deals", [])
 
         if contacts:
-            prompt_parts.append(f"\n## Contacts ({len(contacts)})\n")
+            w(f"\n## Contacts ({len(contacts)})\n\n")
             for contact in contacts[:5]:  # Limit to first 5
-                prompt_parts.append(self._format_contact(contact))
+                self._format_contact(contact, w)
 
         if companies:
-            prompt_parts.append(f"\n## Companies ({len(companies)})\n")
+            w(f"\n## Companies ({len(companies)})\n\n")
             for company in companies[:3]:  # Limit to first 3
-                prompt_parts.append(self._format_company(company))
+                self._format_company(company, w)
 
         if deals and primary_type != "deal":
-            prompt_parts.append(f"\n## Deals ({len(deals)})\n")
+            w(f"\n## Deals ({len(deals)})\n\n")
             for deal in deals[:5]:
-                prompt_parts.append(self._format_deal(deal))
+                self._format_deal(deal, w)
 
         # Interaction history
         notes = interaction_history.get("notes", [])
         tasks = interaction_history.get("tasks", [])
 
         if notes:
-            prompt_parts.append(f"\n## Notes ({len(notes)})\n")
+            w(f"\n## Notes ({len(notes)})\n\n")
             for note in notes:
-                prompt_parts.append(self._format_note(note))
+                self._format_note(note, w)
 
         if tasks:
-            prompt_parts.append(f"\n## Tasks ({len(tasks)})\n")
+            w(f"\n## Tasks ({len(tasks)})\n\n")
             for task in tasks:
-                prompt_parts.append(self._format_task(task))
+                self._format_task(task, w)
 
-        # Final instruction
-        prompt_parts.append("\n\n---\n")
-        prompt_parts.append("**Please analyze this CRM data and generate a comprehensive deal summary in Markdown format following the specified structure.**")
-
-        return "\n".join(prompt_parts)
-
-    def _format_primary_entity(self, entity_type: str, record: Dict[str, Any]) -> str:
-        """Format primary entity information."""
-        if entity_type == "deal":
-            return self._format_deal(record)
-        elif entity_type == "contact":
-            return self._format_contact(record)
-        elif entity_type == "company":
-            return self._format_company(record)
-        return str(record)
-
-    def _format_contact(self, contact: Dict[str, Any]) -> str:
-        """Format contact information."""
-        lines = []
-        lines.append(f"**Contact:** {contact.get('email', 'N/A')}")
-
-        attrs = contact.get('attributes', {})
-        if attrs.get('PRENOM') or attrs.get('NOM'):
-            name = f"{attrs.get('PRENOM', '')} {attrs.get('NOM', '')}".strip()
-            if name:
-                lines.append(f"- Name: {name}")
-
-        if attrs.get('ENT_COMPANY_NAME'):
-            lines.append(f"- Company: {attrs['ENT_COMPANY_NAME']}")
-
-        if contact.get('createdAt'):
-            lines.append(f"- Created: {contact['createdAt']}")
-
-        return "\n".join(lines) + "\n"
-
-    def _format_company(self, company: Dict[str, Any]) -> str:
-        """Format company information."""
-        lines = []
-        attrs = company.get('attributes', {})
+        # Per-call context: everything that varies between regenerations of
+        # the same deal goes after the cacheable data dump
+        dynamic_parts = []
 
-        name = attrs.get('name', 'Unknown Company')
-        lines.append(f"**Company:** {name}")
-
-        if attrs.get('domain'):
-            lines.append(f"- Domain: {attrs['domain']}")
-
-        if attrs.get('industry'):
-            lines.append(f"- Industry: {attrs['industry']}")
-
-        if company.get('linkedContactsIds'):
-            lines.append(f"- Linked Contacts: {len(company['linkedContactsIds'])}")
-
-        return "\n".join(lines) + "\n"
-
-    def _format_deal(self, deal: Dict[str, Any]) -> str:
-        """Format deal information."""
-        lines = []
-        attrs = deal.get('attributes', {})
-
-        deal_name = attrs.get('deal_name', 'Unnamed Deal')
-        lines.append(f"**Deal:** {deal_name}")
-
-        # Use deal_stage_name if available, otherwise fall back to deal_stage ID
-        stage_name = attrs.get('deal_stage_name') or attrs.get('deal_stage')
-        if stage_name:
-            lines.append(f"- Stage: {stage_name}")
-
-        if attrs.get('deal_value'):
-            lines.append(f"- Value: {attrs['deal_value']}")
-
-        if deal.get('linkedContactsIds'):
-            lines.append(f"- Linked Contacts: {len(deal['linkedContactsIds'])}")
+        if previous_summary and diff:
+            dynamic_parts.append("\n**This is an update to a previous summary. Data has changed or sufficient time has passed.**\n")
 
-        if deal.get('linkedCompaniesIds'):
-            lines.append(f"- Linked Companies: {len(deal['linkedCompaniesIds'])}")
+        # Include previous summary context if available
+        if previous_summary:
+            dynamic_parts.append("\n## Previous Summary Context\n")
+            dynamic_parts.append(f"**Generated:** {previous_summary.get('generated_at', 'Unknown')}\n")
+            dynamic_parts.append(f"**Executive Summary:** {previous_summary.get('executive_summary', 'N/A')}\n")
+            if previous_summary.get('current_status'):
+                dynamic_parts.append(f"**Previous Status:** {previous_summary.get('current_status')}\n")
 
-        return "\n".join(lines) + "\n"
+        # Include diff if available
+        if diff:
+            dynamic_parts.append("\n" + format_diff_for_ai(diff))
 
-    def _format_note(self, note: Dict[str, Any]) -> str:
-        """Format note information."""
-        lines = []
+        # Focus areas if specified
+        if focus_areas:
+            dynamic_parts.append(f"\n**Focus on these areas:** {', '.join(focus_areas)}\n")
 
+        # Final instruction
+        dynamic_parts.append("\n\n---\n")
+        dynamic_parts.append("**Please analyze this CRM data and generate a comprehensive deal summary in Markdown format following the specified structure.**")
+
+        return [
+            {
+                "type": "text",
+                "text": buf.getvalue(),
+                "cache_control": {"type": "ephemeral"}
+            },
+            {
+                "type": "text",
+                "text": "\n".join(dynamic_parts)
+            },
+        ]
+
+    def _format_primary_entity(self, entity_type: str, record: Dict[str, Any], w) -> None:
+        """Write primary entity information into the prompt buffer."""
+        if entity_type == "deal":
+            self._format_deal(record, w)
+        elif entity_type == "contact":
+            self._format_contact(record, w)
+        elif entity_type == "company":
+            self._format_company(record, w)
+        else:
+            # Unknown entity type: a compact key listing instead of the full
+            # repr, which for a large record is slow to build and wastes
+            # prompt tokens on Python syntax
+            logger.warning("No formatter for primary entity type '%s'", entity_type)
+            w(f"**Entity ({entity_type}):** id={record.get('id', 'unknown')}")
+            keys = list(record)[:20]
+            if keys:
+                w(f"\n- Fields: {', '.join(keys)}")
+            w("\n\n")
+
+    # Brevo payloads omit attributes freely, so operator.itemgetter (which
+    # raises KeyError) doesn't fit here; binding the .get methods once per
+    # record gets the same effect - one attribute lookup instead of one per
+    # field - while keeping per-field defaults.
+    def _format_contact(self, contact: Dict[str, Any], w) -> None:
+        """Write contact information into the prompt buffer."""
+        get = contact.get
+        aget = get('attributes', {}).get
+        w(_render_contact(
+            get('email', 'N/A'),
+            aget('PRENOM', ''),
+            aget('NOM', ''),
+            aget('ENT_COMPANY_NAME'),
+            get('createdAt')
+        ))
+
+    def _format_company(self, company: Dict[str, Any], w) -> None:
+        """Write company information into the prompt buffer."""
+        aget = company.get('attributes', {}).get
+        linked = company.get('linkedContactsIds')
+        w(_render_company(
+            aget('name', 'Unknown Company'),
+            aget('domain'),
+            aget('industry'),
+            len(linked) if linked else 0
+        ))
+
+    def _format_deal(self, deal: Dict[str, Any], w) -> None:
+        """Write deal information into the prompt buffer."""
+        get = deal.get
+        aget = get('attributes', {}).get
+        linked_contacts = get('linkedContactsIds')
+        linked_companies = get('linkedCompaniesIds')
+        w(_render_deal(
+            aget('deal_name', 'Unnamed Deal'),
+            aget('deal_stage_name') or aget('deal_stage'),
+            aget('deal_value'),
+            len(linked_contacts) if linked_contacts else 0,
+            len(linked_companies) if linked_companies else 0
+        ))
+
+    def _format_note(self, note: Dict[str, Any], w) -> None:
+        """Write note information into the prompt buffer."""
         created = note.get('createdAt', 'Unknown date')
-        lines.append(f"**Note ({created}):**")
+        w(f"**Note ({created}):**\n")
 
         text = note.get('text', '')
-        # Clean HTML tags for better readability
-        import re
-        text = re.sub(r'<[^>]+>', '', text)
-        text = re.sub(r'\s+', ' ', text).strip()
+        # Only the first 500 clean chars survive, so bound the regex work on
+        # very long notes - 4000 raw chars leaves ample margin for markup
+        if len(text) > 4000:
+            text = text[:4000]
+        # Clean HTML tags and collapse whitespace in one pass
+        text = _clean_note_text(text)
 
         # Limit length
         if len(text) > 500:
             text = text[:500] + "..."
 
-        lines.append(text)
-        return "\n".join(lines) + "\n"
-
-    def _format_task(self, task: Dict[str, Any]) -> str:
-        """Format task information."""
-        lines = []
+        w(text)
+        w("\n\n")
 
+    def _format_task(self, task: Dict[str, Any], w) -> None:
+        """Write task information into the prompt buffer."""
         name = task.get('name', 'Unnamed task')
         due_date = task.get('date', 'No date')
         done = task.get('done', False)
         status = "✓ Done" if done else "○ Pending"
 
-        lines.append(f"**{status}** {name} (Due: {due_date})")
+        w(f"**{status}** {name} (Due: {due_date})")
 
         if task.get('notes'):
             notes = task['notes'][:200]
-            lines.append(f"  Notes: {notes}")
+            w(f"\n  Notes: {notes}")
 
-        return "\n".join(lines) + "\n"
+        w("\n\n")
 
-    def _extract_deal_name(self, enriched_data: Dict[str, Any]) -> str:
-        """Extract deal name from enriched data."""
-        primary_record = enriched_data.get("primary_record", {})
-        attrs = primary_record.get("attributes", {})
-        return attrs.get("deal_name", "Unknown Deal")
-
-    def _extract_deal_id(self, enriched_data: Dict[str, Any]) -> str:
-        """Extract deal ID from enriched data."""
-        primary_record = enriched_data.get("primary_record", {})
-        return str(primary_record.get("id", "unknown"))
+    def _extract_core_fields(self, enriched_data: Dict[str, Any]) -> tuple:
+        """
+        Extract (deal_name, deal_id, company_name) in one pass.
 
-    def _extract_company_name(self, enriched_data: Dict[str, Any]) -> Optional[str]:
-        """Extract company name from enriched data."""
-        # Try from primary record attributes
-        primary_record = enriched_data.get("primary_record", {})
-        attrs = primary_record.get("attributes", {})
-        company_name = attrs.get("company_name")
+        Binds primary_record/attributes once instead of re-walking the
+        payload per field.
+        """
+        primary_record = enriched_data.get("primary_record") or {}
+        attrs = primary_record.get("attributes") or {}
 
-        if company_name:
-            return company_name
+        deal_name = attrs.get("deal_name", "Unknown Deal")
+        deal_id = str(primary_record.get("id", "unknown"))
 
-        # Try from related companies
-        related_entities = enriched_data.get("related_entities", {})
-        companies = related_entities.get("companies", [])
-        if companies:
-            first_company = companies[0]
-            company_attrs = first_company.get("attributes", {})
-            return company_attrs.get("name")
+        company_name = attrs.get("company_name")
+        if not company_name:
+            # Fall back to the first related company
+            companies = (enriched_data.get("related_entities") or {}).get("companies")
+            if companies:
+                company_name = (companies[0].get("attributes") or {}).get("name")
 
-        return None
+        return deal_name, deal_id, company_name
 
     def _build_fallback_summary(
         self,
@@ -423,13 +770,12 @@ class DealSummarizer:
         """
         logger.warning("Building fallback summary")
 
-        primary_record = enriched_data.get("primary_record", {})
-        attrs = primary_record.get("attributes", {})
+        deal_name, deal_id, company_name = self._extract_core_fields(enriched_data)
 
         return DealSummary(
-            deal_name=attrs.get("deal_name", "Unknown Deal"),
-            deal_id=str(primary_record.get("id", "unknown")),
-            company_name=attrs.get("company_name", None),
+            deal_name=deal_name,
+            deal_id=deal_id,
+            company_name=company_name,
             executive_summary="Summary generation failed. Please review raw data.",
             deal_context="An error occurred during AI summarization. Raw response: " + raw_response[:500],
             current_status="Unable to determine",